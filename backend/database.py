@@ -1,8 +1,9 @@
 """
 Database configuration and models for Upwork DNA
 """
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, Float, Boolean, event
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, Float, Boolean, Index, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 from datetime import datetime
@@ -20,6 +21,11 @@ if IS_SQLITE:
     }
     # Avoid queue-pool starvation under bursty local requests.
     engine_kwargs["poolclass"] = NullPool
+elif make_url(DATABASE_URL).get_driver_name() == "psycopg2":
+    # Batch executemany() INSERT/UPDATEs into a few round-trips instead of one per row.
+    engine_kwargs["executemany_mode"] = "values_plus_batch"
+    engine_kwargs["insertmanyvalues_page_size"] = 1000
+    engine_kwargs["executemany_batch_page_size"] = 500
 
 engine = create_engine(
     DATABASE_URL,
@@ -137,6 +143,10 @@ class IngestedFile(Base):
     last_modified_at = Column(DateTime, nullable=False)
     ingested_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        Index("ix_ingested_files_ingested_at_desc", ingested_at.desc()),
+    )
+
 
 class JobRaw(Base):
     """Normalized jobs ingested from extension exports."""
@@ -154,6 +164,7 @@ class JobRaw(Base):
     payment_verified = Column(Boolean, default=False)
     proposals = Column(String)
     skills = Column(Text)
+    fit_blob = Column(Text)  # Lower-cased title/description/skills/keyword for fit scoring
     posted_at = Column(DateTime, nullable=True)  # Parsed from "Posted 2 hours ago" etc.
     source_file = Column(String)
     scraped_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -268,6 +279,10 @@ class PipelineEvent(Base):
     payload = Column(Text, default="{}")
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
+    __table_args__ = (
+        Index("ix_pipeline_events_type_created", event_type, created_at.desc()),
+    )
+
 
 class QueueTelemetry(Base):
     """Latest queue telemetry snapshot pushed by extension."""
@@ -295,6 +310,31 @@ def get_db():
         db.close()
 
 
+def _add_missing_columns():
+    """Add columns introduced after a table was first created (create_all skips them)."""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                col_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}"))
+
+
+def _add_missing_indexes():
+    """Create indexes declared after a table was first created (create_all skips them)."""
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+
+
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+    _add_missing_indexes()
@@ -753,14 +753,13 @@ async def run_scraping_job(
             save_to_file=False
         )
 
-        results = {'jobs': [], 'talent': [], 'projects': []}
         total_items = 0
 
-        # Run scraper using existing UpworkScraper
+        # Run scraper using existing UpworkScraper; items are stored as each
+        # result page is parsed, while the following pages are still loading
         async with UpworkScraper(config) as scraper:
             if job_type in ['jobs', 'all']:
-                jobs = await scraper.search_jobs(keyword, max_pages=max_pages)
-                for job in jobs:
+                async for job in scraper.iter_jobs(keyword, max_pages=max_pages):
                     job_dict = job.to_dict()
                     job_dict['keyword'] = keyword
                     existing = db.query(Job).filter(Job.url == job_dict.get('url')).first()
@@ -768,11 +767,9 @@ async def run_scraping_job(
                         db_job = Job(**job_dict)
                         db.add(db_job)
                         total_items += 1
-                    results['jobs'].append(job_dict)
 
             if job_type in ['talent', 'all']:
-                talents = await scraper.search_talent(keyword, max_pages=max_pages)
-                for talent in talents:
+                async for talent in scraper.iter_talent(keyword, max_pages=max_pages):
                     talent_dict = talent.to_dict()
                     talent_dict['keyword'] = keyword
                     # Map fields to match database schema
@@ -782,11 +779,9 @@ async def run_scraping_job(
                         db_talent = Talent(**talent_dict)
                         db.add(db_talent)
                         total_items += 1
-                    results['talent'].append(talent_dict)
 
             if job_type in ['projects', 'all']:
-                projects = await scraper.search_projects(keyword, max_pages=max_pages)
-                for project in projects:
+                async for project in scraper.iter_projects(keyword, max_pages=max_pages):
                     project_dict = project.to_dict()
                     project_dict['keyword'] = keyword
                     existing = db.query(Project).filter(Project.url == project_dict.get('url')).first()
@@ -794,7 +789,6 @@ async def run_scraping_job(
                         db_project = Project(**project_dict)
                         db.add(db_project)
                         total_items += 1
-                    results['projects'].append(project_dict)
 
         db.commit()
 
@@ -3,15 +3,26 @@ Local orchestrator service for ingest -> scoring -> recommendation cycle.
 """
 from __future__ import annotations
 
-import csv
 import hashlib
-import json
+import logging
+import mmap
 import os
 import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
-
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import ciso8601
+import orjson
+import pandas as pd
+from sqlalchemy import bindparam, func, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from database import (
@@ -28,8 +39,17 @@ from database import (
     TalentRaw,
 )
 
+logger = logging.getLogger(__name__)
+
 
 RECOMMENDATION_LIMIT_DEFAULT = 100
+KEY_LOOKUP_BATCH = 500
+PARSE_AHEAD_PER_WORKER = 2
+PARSE_CACHE_SIZE = 100_000
+KEY_MAP_CACHE_SIZE = 1024
+STATUS_CACHE_TTL_SECONDS = 2.0
+# Dialects with INSERT ... ON CONFLICT DO UPDATE; others use the ORM merge path.
+UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
 SUSPICIOUS_TERMS = {
     "telegram",
     "whatsapp",
@@ -106,6 +126,85 @@ FIT_TERM_WEIGHTS = {
     "bookkeeping": -15,
 }
 
+# One regex pass finds every fit term in a text. Alternatives are tried
+# longest-first inside a lookahead, so each position reports its longest term;
+# shorter terms that are prefixes of it are added back via _FIT_TERM_PREFIXES.
+_FIT_TERMS_PATTERN = re.compile(
+    "(?=("
+    + "|".join(re.escape(term) for term in sorted(FIT_TERM_WEIGHTS, key=len, reverse=True))
+    + "))"
+)
+_FIT_TERM_PREFIXES = {
+    term: [other for other in FIT_TERM_WEIGHTS if term.startswith(other)]
+    for term in FIT_TERM_WEIGHTS
+}
+_FIT_TERM_ORDER = {term: index for index, term in enumerate(FIT_TERM_WEIGHTS)}
+_FLOAT_RE = re.compile(r"\d+(?:\.\d+)?")
+_INT_RE = re.compile(r"\d+")
+_MONEY_RE = re.compile(r"(\d+(?:\.\d+)?)(k)?")
+
+# ─── Ingest column aliases ──────────────────────────────────
+# Built once at import; the per-row normalizers only index into these.
+JOB_FIELD_KEYS = {
+    "title": ("title", "job_title"),
+    "description": (
+        "description",
+        "snippet",
+        "summary",
+        "detail_summary",
+        "detail_description",
+        "overview",
+    ),
+    "url": ("url", "job_url", "detail_job_url", "detail_url"),
+    "budget": ("budget", "hourly_rate", "price", "payment"),
+    "client_spend": ("client_spend", "spent", "client_total_spent"),
+    "payment_verified": ("payment_verified", "client_payment_verified", "is_payment_verified"),
+    "proposals": ("proposals", "proposal_count", "bids"),
+    "skills": ("skills", "skill_tags", "tags"),
+    "keyword": ("keyword", "search_keyword", "query"),
+    "scraped_at": ("scraped_at", "timestamp", "created_at"),
+    "posted_at": ("detail_posted", "posted", "posted_date"),
+}
+JOB_SIGNAL_KEYS = (
+    ("job_availability", ("detail_job_availability",)),
+    ("posted", ("detail_posted", "posted", "posted_date")),
+    ("activity_last_viewed", ("detail_activity_last_viewed",)),
+    ("activity_interviewing", ("detail_activity_interviewing",)),
+    ("activity_invites_sent", ("detail_activity_invites_sent",)),
+    ("activity_unanswered_invites", ("detail_activity_unanswered_invites",)),
+    ("activity_proposals", ("detail_activity_proposals",)),
+    ("client_hire_rate", ("detail_client_hire_rate",)),
+    ("client_jobs_posted", ("detail_client_jobs_posted",)),
+    ("client_open_jobs", ("detail_client_open_jobs",)),
+    ("client_member_since", ("detail_client_member_since",)),
+)
+TALENT_FIELD_KEYS = {
+    "name": ("name", "full_name"),
+    "title": ("title", "headline"),
+    "description": ("description", "overview", "bio", "summary"),
+    "url": ("url", "profile_url", "detail_profile_url"),
+    "hourly_rate": ("hourly_rate", "rate", "price"),
+    "skills": ("skills", "tags"),
+    "keyword": ("keyword", "search_keyword"),
+    "scraped_at": ("scraped_at", "timestamp", "created_at"),
+    "country": ("country", "location"),
+    "rating": ("rating", "score"),
+    "jobs_completed": ("jobs_completed", "jobs"),
+}
+PROJECT_FIELD_KEYS = {
+    "title": ("title", "project_title"),
+    "description": ("description", "summary", "detail_project_description"),
+    "url": ("url", "project_url", "detail_project_url"),
+    "price": ("price", "budget"),
+    "keyword": ("keyword", "search_keyword"),
+    "scraped_at": ("scraped_at", "timestamp", "created_at"),
+    "category": ("category", "service_category"),
+    "rating": ("rating", "score"),
+    "sales": ("sales", "orders"),
+}
+_MISSING_VALUES = (None, "", "nan", "None")
+_NO_KEY = object()
+
 # Staleness thresholds for proposals
 PROPOSALS_FRESH_MAX = 15     # 0-15 proposals = fresh job
 PROPOSALS_STALE_THRESHOLD = 30   # 30+ proposals = getting stale
@@ -122,13 +221,19 @@ def parse_money_value(value: Any) -> Optional[float]:
         return None
     if isinstance(value, (int, float)):
         return float(value)
+    return _parse_money_text(str(value))
+
 
-    text = str(value).strip().lower()
+# Scraped budgets/proposals/flags repeat heavily across rows, so the string
+# parsers below are memoized; the cached results are immutable scalars.
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_money_text(value: str) -> Optional[float]:
+    text = value.strip().lower()
     if not text:
         return None
 
     text = text.replace(",", "")
-    range_match = re.findall(r"(\d+(?:\.\d+)?)(k)?", text)
+    range_match = _MONEY_RE.findall(text)
     if not range_match:
         return None
 
@@ -151,7 +256,12 @@ def parse_int_value(value: Any) -> Optional[int]:
         return value
     if isinstance(value, float):
         return int(value)
-    match = re.search(r"\d+", str(value))
+    return _parse_int_text(str(value))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_int_text(value: str) -> Optional[int]:
+    match = _INT_RE.search(value)
     if not match:
         return None
     return int(match.group(0))
@@ -162,18 +272,79 @@ def parse_bool_value(value: Any) -> bool:
         return value
     if value is None:
         return False
-    text = str(value).strip().lower()
-    return text in {"1", "true", "yes", "verified", "payment verified", "y"}
+    return _parse_bool_text(str(value))
+
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_bool_text(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "verified", "payment verified", "y"}
 
-def pick_first(record: Dict[str, Any], candidates: Iterable[str], default: Any = "") -> Any:
+
+def pick_first(record: Mapping[str, Any], candidates: Iterable[str], default: Any = "") -> Any:
     for key in candidates:
-        if key in record and record[key] not in (None, "", "nan", "None"):
-            return record[key]
+        value = record.get(key)
+        if value not in _MISSING_VALUES:
+            return value
     return default
 
 
+class LowerKeyRow(Mapping):
+    """Read-only view of a dict under lower-cased keys, without copying it."""
+
+    __slots__ = ("_row", "_key_map")
+
+    def __init__(self, row: Dict[Any, Any], key_map: Dict[str, Any]):
+        self._row = row
+        self._key_map = key_map
+
+    def __getitem__(self, key: str) -> Any:
+        return self._row[self._key_map[key]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        original = self._key_map.get(key, _NO_KEY)
+        if original is _NO_KEY:
+            return default
+        return self._row.get(original, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._key_map
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._key_map)
+
+    def __len__(self) -> int:
+        return len(self._key_map)
+
+
+def lower_key_rows(items: Iterable[Any]) -> Iterator[LowerKeyRow]:
+    """Yield a LowerKeyRow per dict item; key maps are shared by items with the same keys."""
+    key_maps: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        shape = tuple(item)
+        key_map = key_maps.get(shape)
+        if key_map is None:
+            if len(key_maps) >= KEY_MAP_CACHE_SIZE:
+                key_maps.clear()
+            key_map = key_maps[shape] = {str(k).lower(): k for k in shape}
+        yield LowerKeyRow(item, key_map)
+
+
+def pick_first_column(frame: pd.DataFrame, candidates: Iterable[str], default: str = "") -> pd.Series:
+    """Column-wise pick_first: first usable value per row, stripped, else default."""
+    result = pd.Series(default, index=frame.index, dtype=object)
+    for key in reversed(list(candidates)):
+        if key in frame.columns:
+            column = frame[key]
+            result = column.where(~column.isin(["", "nan", "None"]), result)
+    result = result.astype(str).str.strip()
+    return result.where(result != "", default)
+
+
 def normalize_text(value: Any) -> str:
+    if type(value) is str:
+        return value
     if value is None:
         return ""
     if isinstance(value, list):
@@ -181,17 +352,34 @@ def normalize_text(value: Any) -> str:
     return str(value)
 
 
+def _dumps(value: Any) -> str:
+    """Serialize a JSON column value (UTF-8, no ASCII escaping)."""
+    return orjson.dumps(value).decode()
+
+
 def normalize_json_list(value: Any) -> str:
     if isinstance(value, str):
         return value
     if value is None:
         return "[]"
     try:
-        return json.dumps(list(value), ensure_ascii=False)
+        return _dumps(list(value))
     except Exception:
         return "[]"
 
 
+def build_fit_blob(title: Any, description: Any, skills: Any, keyword: Any) -> str:
+    """Lower-cased text used for fit scoring, cached on JobRaw at ingest."""
+    return " ".join(
+        [
+            normalize_text(title),
+            normalize_text(description),
+            normalize_text(skills),
+            normalize_text(keyword),
+        ]
+    ).lower()
+
+
 def derive_job_key(url: str, title: str, keyword: str) -> str:
     if url:
         m = re.search(r"/jobs?/([^/?#]+)", url)
@@ -272,8 +460,20 @@ def score_priority(opportunity_score: float) -> str:
     return "LOW"
 
 
+def find_fit_terms(normalized: str) -> List[str]:
+    """FIT_TERM_WEIGHTS terms contained in lower-cased text, in declaration order."""
+    found = set()
+    for term in set(_FIT_TERMS_PATTERN.findall(normalized)):
+        found.update(_FIT_TERM_PREFIXES[term])
+    return sorted(found, key=_FIT_TERM_ORDER.__getitem__)
+
+
 def compute_fit_score(text: str) -> float:
-    normalized = text.lower()
+    return compute_fit_score_lower(text.lower())
+
+
+def compute_fit_score_lower(normalized: str) -> float:
+    """Same as compute_fit_score, for text that is already lower-cased."""
     weights = dict(FIT_TERM_WEIGHTS)
 
     # Dynamic keyword augmentation from synced Upwork profile
@@ -417,6 +617,12 @@ class OrchestratorService:
         )
         self.data_root = Path(root).expanduser()
         self.data_root.mkdir(parents=True, exist_ok=True)
+        self._hash_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        # Bumped after every commit made through this service; cached status
+        # payloads are only reused while the epoch they were built at is current.
+        self._mutation_epoch = 0
+        self._summary_cache: Optional[Tuple[int, float, Dict[str, Any]]] = None
+        self._telemetry_cache: Optional[Tuple[int, float, Dict[str, Any]]] = None
 
     def scan_and_ingest(self, db: Session) -> Dict[str, Any]:
         files = [
@@ -428,60 +634,77 @@ class OrchestratorService:
         created = 0
         updated = 0
 
+        changed_files = []
         for file_path in files:
             scanned += 1
             payload_hash = self._compute_file_hash(file_path)
-            rel_path = str(file_path)
-            stats = file_path.stat()
             existing = (
                 db.query(IngestedFile)
-                .filter(IngestedFile.file_path == rel_path)
+                .filter(IngestedFile.file_path == str(file_path))
                 .first()
             )
 
             if existing and existing.file_hash == payload_hash:
                 continue
+            changed_files.append((file_path, payload_hash, existing))
 
-            parsed = self._parse_file(file_path)
-            if parsed["jobs"]:
-                self._upsert_jobs(db, parsed["jobs"], rel_path)
-            if parsed["talent"]:
-                self._upsert_talent(db, parsed["talent"], rel_path)
-            if parsed["projects"]:
-                self._upsert_projects(db, parsed["projects"], rel_path)
-
-            dataset = detect_dataset_from_filename(file_path)
-            inferred_keyword = parsed["keyword"] or infer_keyword_from_path(file_path)
-            row_count = (
-                len(parsed["jobs"]) + len(parsed["talent"]) + len(parsed["projects"])
-            )
+        # File parsing is independent per file; DB writes stay on the calling thread.
+        # The pool lives only for this scan, and pending parses are cancelled if
+        # an upsert fails.
+        workers = os.cpu_count() or 1
+        parse_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest-parse")
+        try:
+            # Parse ahead in ingest order, at most PARSE_AHEAD_PER_WORKER files per
+            # worker, so a large backlog never holds every parsed file at once.
+            upcoming = (parse_pool.submit(self._parse_file, item[0]) for item in changed_files)
+            parse_futures = deque(islice(upcoming, PARSE_AHEAD_PER_WORKER * workers))
+
+            for file_path, payload_hash, existing in changed_files:
+                rel_path = str(file_path)
+                stats = file_path.stat()
+                parsed = parse_futures.popleft().result()
+                parse_futures.extend(islice(upcoming, 1))
+                if parsed["jobs"]:
+                    self._upsert_jobs(db, parsed["jobs"], rel_path)
+                if parsed["talent"]:
+                    self._upsert_talent(db, parsed["talent"], rel_path)
+                if parsed["projects"]:
+                    self._upsert_projects(db, parsed["projects"], rel_path)
+
+                dataset = detect_dataset_from_filename(file_path)
+                inferred_keyword = parsed["keyword"] or infer_keyword_from_path(file_path)
+                row_count = (
+                    len(parsed["jobs"]) + len(parsed["talent"]) + len(parsed["projects"])
+                )
 
-            if existing:
-                existing.file_hash = payload_hash
-                existing.file_type = file_path.suffix.lower().lstrip(".")
-                existing.dataset = dataset
-                existing.keyword = inferred_keyword
-                existing.row_count = row_count
-                existing.last_modified_at = datetime.utcfromtimestamp(stats.st_mtime)
-                existing.ingested_at = datetime.utcnow()
-                updated += 1
-            else:
-                db.add(
-                    IngestedFile(
-                        file_path=rel_path,
-                        file_hash=payload_hash,
-                        file_type=file_path.suffix.lower().lstrip("."),
-                        dataset=dataset,
-                        keyword=inferred_keyword,
-                        row_count=row_count,
-                        last_modified_at=datetime.utcfromtimestamp(stats.st_mtime),
+                if existing:
+                    existing.file_hash = payload_hash
+                    existing.file_type = file_path.suffix.lower().lstrip(".")
+                    existing.dataset = dataset
+                    existing.keyword = inferred_keyword
+                    existing.row_count = row_count
+                    existing.last_modified_at = datetime.utcfromtimestamp(stats.st_mtime)
+                    existing.ingested_at = datetime.utcnow()
+                    updated += 1
+                else:
+                    db.add(
+                        IngestedFile(
+                            file_path=rel_path,
+                            file_hash=payload_hash,
+                            file_type=file_path.suffix.lower().lstrip("."),
+                            dataset=dataset,
+                            keyword=inferred_keyword,
+                            row_count=row_count,
+                            last_modified_at=datetime.utcfromtimestamp(stats.st_mtime),
+                        )
                     )
-                )
-                created += 1
+                    created += 1
 
-            # Keep write locks short; commit each changed file chunk.
-            db.flush()
-            db.commit()
+                # Keep write locks short; commit each changed file chunk.
+                db.flush()
+                self._commit(db)
+        finally:
+            parse_pool.shutdown(cancel_futures=True)
 
         refreshed_at = self.refresh_metrics_and_opportunities(db)
 
@@ -492,7 +715,7 @@ class OrchestratorService:
             "refreshed_at": refreshed_at.isoformat(),
         }
         self._log_event(db, "ingest_scan", event_payload)
-        db.commit()
+        self._commit(db)
 
         return {
             "scanned_files": scanned,
@@ -513,30 +736,25 @@ class OrchestratorService:
         keyword = normalize_text(run.get("keyword", "")).strip() or "general"
         data = run.get("data") if isinstance(run.get("data"), dict) else {}
 
-        jobs_rows: List[Dict[str, Any]] = []
-        talent_rows: List[Dict[str, Any]] = []
-        project_rows: List[Dict[str, Any]] = []
+        # Keyed by natural key: duplicates collapse here, last row wins.
+        jobs_rows: Dict[str, Dict[str, Any]] = {}
+        talent_rows: Dict[str, Dict[str, Any]] = {}
+        project_rows: Dict[str, Dict[str, Any]] = {}
 
-        for row in data.get("jobs", []) if isinstance(data.get("jobs"), list) else []:
-            if not isinstance(row, dict):
-                continue
-            normalized = {str(k).lower(): v for k, v in row.items()}
+        for normalized in lower_key_rows(data.get("jobs") if isinstance(data.get("jobs"), list) else []):
             row_keyword = normalize_text(pick_first(normalized, ["keyword", "search_keyword"], keyword)).strip() or keyword
-            jobs_rows.append(self._normalize_job_row(normalized, row_keyword))
+            job = self._normalize_job_row(normalized, row_keyword)
+            jobs_rows[job["job_key"]] = job
 
-        for row in data.get("talent", []) if isinstance(data.get("talent"), list) else []:
-            if not isinstance(row, dict):
-                continue
-            normalized = {str(k).lower(): v for k, v in row.items()}
+        for normalized in lower_key_rows(data.get("talent") if isinstance(data.get("talent"), list) else []):
             row_keyword = normalize_text(pick_first(normalized, ["keyword", "search_keyword"], keyword)).strip() or keyword
-            talent_rows.append(self._normalize_talent_row(normalized, row_keyword))
+            profile = self._normalize_talent_row(normalized, row_keyword)
+            talent_rows[profile["talent_key"]] = profile
 
-        for row in data.get("projects", []) if isinstance(data.get("projects"), list) else []:
-            if not isinstance(row, dict):
-                continue
-            normalized = {str(k).lower(): v for k, v in row.items()}
+        for normalized in lower_key_rows(data.get("projects") if isinstance(data.get("projects"), list) else []):
             row_keyword = normalize_text(pick_first(normalized, ["keyword", "search_keyword"], keyword)).strip() or keyword
-            project_rows.append(self._normalize_project_row(normalized, row_keyword))
+            project = self._normalize_project_row(normalized, row_keyword)
+            project_rows[project["project_key"]] = project
 
         source = f"extension_run:{run_id}"
         if jobs_rows:
@@ -546,7 +764,7 @@ class OrchestratorService:
         if project_rows:
             self._upsert_projects(db, project_rows, source)
 
-        db.commit()
+        self._commit(db)
         refreshed_at = datetime.utcnow()
         if refresh_metrics:
             refreshed_at = self.refresh_metrics_and_opportunities(db)
@@ -561,31 +779,29 @@ class OrchestratorService:
             "updated_metrics_at": refreshed_at.isoformat(),
         }
         self._log_event(db, "ingest_run_payload", event_payload)
-        db.commit()
+        self._commit(db)
 
         return event_payload
 
     def refresh_metrics_and_opportunities(self, db: Session) -> datetime:
         refreshed_at = datetime.utcnow()
         keywords = {
-            row.keyword
-            for row in db.query(JobRaw.keyword).filter(JobRaw.keyword.isnot(None)).all()
-            if row.keyword
+            keyword
+            for (keyword,) in db.query(JobRaw.keyword).filter(JobRaw.keyword.isnot(None)).distinct()
+            if keyword
         }
         keywords.update(
-            {
-                row.keyword
-                for row in db.query(TalentRaw.keyword)
-                .filter(TalentRaw.keyword.isnot(None))
-                .all()
-                if row.keyword
-            }
+            keyword
+            for (keyword,) in db.query(TalentRaw.keyword)
+            .filter(TalentRaw.keyword.isnot(None))
+            .distinct()
+            if keyword
         )
 
         for keyword in keywords:
             self._refresh_keyword_metric(db, keyword, refreshed_at)
         self._refresh_job_opportunities(db, refreshed_at)
-        db.commit()
+        self._commit(db)
         return refreshed_at
 
     def _refresh_keyword_metric(self, db: Session, keyword: str, refreshed_at: datetime) -> None:
@@ -661,14 +877,15 @@ class OrchestratorService:
         recommendation.demand = demand
         recommendation.supply = supply
         recommendation.gap_ratio = round(gap_ratio, 4)
-        recommendation.reason_codes = json.dumps(reasons, ensure_ascii=False)
+        recommendation.reason_codes = _dumps(reasons)
         recommendation.last_updated = refreshed_at
 
     def _refresh_job_opportunities(self, db: Session, refreshed_at: datetime) -> None:
-        keyword_scores = {
-            item.keyword: item.opportunity_score
-            for item in db.query(KeywordRecommendation).all()
-        }
+        keyword_scores = dict(
+            db.query(
+                KeywordRecommendation.keyword, KeywordRecommendation.opportunity_score
+            ).all()
+        )
 
         jobs = db.query(JobRaw).all()
         for job in jobs:
@@ -684,15 +901,10 @@ class OrchestratorService:
                 description=job.description or "",
             )
 
-            fit_blob = " ".join(
-                [
-                    normalize_text(job.title),
-                    normalize_text(job.description),
-                    normalize_text(job.skills),
-                    normalize_text(job.keyword),
-                ]
+            fit_blob = job.fit_blob or build_fit_blob(
+                job.title, job.description, job.skills, job.keyword
             )
-            fit_score = compute_fit_score(fit_blob)
+            fit_score = compute_fit_score_lower(fit_blob)
 
             # ─── Freshness scoring ────────────────────────────
             freshness = compute_freshness_score(
@@ -732,7 +944,7 @@ class OrchestratorService:
             # Skip overwriting if LLM already analyzed this job
             if entry and entry.reasons:
                 try:
-                    existing_reasons = json.loads(entry.reasons)
+                    existing_reasons = orjson.loads(entry.reasons)
                     if isinstance(existing_reasons, dict) and existing_reasons.get("llm_action"):
                         # LLM has already analyzed — only update freshness-related fields
                         if is_dead:
@@ -752,7 +964,7 @@ class OrchestratorService:
             entry.safety_score = safety_score
             entry.fit_score = fit_score
             entry.apply_now = apply_now
-            entry.reasons = json.dumps(reasons, ensure_ascii=False)
+            entry.reasons = _dumps(reasons)
             entry.last_updated = refreshed_at
 
             draft = (
@@ -764,12 +976,8 @@ class OrchestratorService:
 
             generated_draft = self._build_rule_based_draft(job, fit_score, safety_score)
             draft.cover_letter_draft = generated_draft["cover_letter_draft"]
-            draft.hook_points = json.dumps(
-                generated_draft["hook_points"], ensure_ascii=False
-            )
-            draft.caution_notes = json.dumps(
-                generated_draft["caution_notes"], ensure_ascii=False
-            )
+            draft.hook_points = _dumps(generated_draft["hook_points"])
+            draft.caution_notes = _dumps(generated_draft["caution_notes"])
             draft.updated_at = refreshed_at
 
     def get_keyword_recommendations(
@@ -784,8 +992,8 @@ class OrchestratorService:
         output = []
         for row in rows:
             try:
-                reason_codes = json.loads(row.reason_codes or "[]")
-            except json.JSONDecodeError:
+                reason_codes = orjson.loads(row.reason_codes or "[]")
+            except orjson.JSONDecodeError:
                 reason_codes = []
             output.append(
                 {
@@ -813,8 +1021,8 @@ class OrchestratorService:
         output = []
         for row in rows:
             try:
-                reasons = json.loads(row.reasons or "[]")
-            except json.JSONDecodeError:
+                reasons = orjson.loads(row.reasons or "[]")
+            except orjson.JSONDecodeError:
                 reasons = []
             output.append(
                 {
@@ -835,12 +1043,12 @@ class OrchestratorService:
         if not draft:
             return None
         try:
-            hook_points = json.loads(draft.hook_points or "[]")
-        except json.JSONDecodeError:
+            hook_points = orjson.loads(draft.hook_points or "[]")
+        except orjson.JSONDecodeError:
             hook_points = []
         try:
-            caution_notes = json.loads(draft.caution_notes or "[]")
-        except json.JSONDecodeError:
+            caution_notes = orjson.loads(draft.caution_notes or "[]")
+        except orjson.JSONDecodeError:
             caution_notes = []
         return {
             "job_key": job_key,
@@ -873,10 +1081,19 @@ class OrchestratorService:
         db.flush()
 
         self._log_event(db, "queue_telemetry", payload)
-        db.commit()
+        self._commit(db)
         return self.get_queue_telemetry(db)
 
     def get_queue_telemetry(self, db: Session) -> Dict[str, Any]:
+        cached = self._cached_status(self._telemetry_cache)
+        if cached is not None:
+            return cached
+        epoch = self._mutation_epoch
+        result = self._load_queue_telemetry(db)
+        self._telemetry_cache = (epoch, time.monotonic(), result)
+        return dict(result)
+
+    def _load_queue_telemetry(self, db: Session) -> Dict[str, Any]:
         row = db.query(QueueTelemetry).order_by(QueueTelemetry.id.asc()).first()
         if row:
             last_cycle = (
@@ -892,43 +1109,54 @@ class OrchestratorService:
             }
 
         # Backward-compatible fallback: derive from backend queue table
-        total = db.query(QueueItem).count()
-        pending = db.query(QueueItem).filter(QueueItem.status == "pending").count()
-        running = db.query(QueueItem).filter(QueueItem.status == "running").count()
-        completed = db.query(QueueItem).filter(QueueItem.status == "completed").count()
-        error = db.query(QueueItem).filter(QueueItem.status == "failed").count()
+        counts = dict(
+            db.query(QueueItem.status, func.count(QueueItem.id))
+            .group_by(QueueItem.status)
+            .all()
+        )
         return {
-            "total": total,
-            "pending": pending,
-            "running": running,
-            "completed": completed,
-            "error": error,
+            "total": sum(counts.values()),
+            "pending": counts.get("pending", 0),
+            "running": counts.get("running", 0),
+            "completed": counts.get("completed", 0),
+            "error": counts.get("failed", 0),
             "last_cycle_at": None,
         }
 
     def get_summary(self, db: Session) -> Dict[str, Any]:
-        latest_ingest = (
-            db.query(IngestedFile)
-            .order_by(IngestedFile.ingested_at.desc())
-            .first()
-        )
-        latest_pipeline_ingest = (
-            db.query(PipelineEvent)
-            .filter(PipelineEvent.event_type.in_(["ingest_scan", "ingest_run_payload"]))
-            .order_by(PipelineEvent.created_at.desc())
-            .first()
-        )
-        last_ingest_at = latest_ingest.ingested_at if latest_ingest else None
-        if latest_pipeline_ingest and (
-            not last_ingest_at or latest_pipeline_ingest.created_at > last_ingest_at
-        ):
-            last_ingest_at = latest_pipeline_ingest.created_at
+        cached = self._cached_status(self._summary_cache)
+        if cached is not None:
+            return cached
+        epoch = self._mutation_epoch
+        result = self._load_summary(db)
+        self._summary_cache = (epoch, time.monotonic(), result)
+        return dict(result)
+
+    def _load_summary(self, db: Session) -> Dict[str, Any]:
+        def count_of(model: Any) -> Any:
+            return select(func.count()).select_from(model).scalar_subquery()
+
+        # One round-trip for every counter and both "latest ingest" timestamps.
+        row = db.query(
+            count_of(JobRaw).label("jobs_raw"),
+            count_of(TalentRaw).label("talent_raw"),
+            count_of(ProjectRaw).label("projects_raw"),
+            count_of(KeywordRecommendation).label("keywords"),
+            count_of(JobOpportunity).label("opportunities"),
+            select(func.max(IngestedFile.ingested_at)).scalar_subquery().label("latest_file"),
+            select(func.max(PipelineEvent.created_at))
+            .where(PipelineEvent.event_type.in_(["ingest_scan", "ingest_run_payload"]))
+            .scalar_subquery()
+            .label("latest_event"),
+        ).one()
+        stamps = [ts for ts in (row.latest_file, row.latest_event) if ts]
+        last_ingest_at = max(stamps) if stamps else None
         return {
-            "jobs_raw": db.query(JobRaw).count(),
-            "talent_raw": db.query(TalentRaw).count(),
-            "projects_raw": db.query(ProjectRaw).count(),
-            "keywords": db.query(KeywordRecommendation).count(),
-            "opportunities": db.query(JobOpportunity).count(),
+            "jobs_raw": int(row.jobs_raw or 0),
+            "talent_raw": int(row.talent_raw or 0),
+            "projects_raw": int(row.projects_raw or 0),
+            "keywords": int(row.keywords or 0),
+            "opportunities": int(row.opportunities or 0),
             "last_ingest_at": last_ingest_at.isoformat() if last_ingest_at else None,
         }
 
@@ -965,7 +1193,7 @@ class OrchestratorService:
         text_blob = " ".join(
             [normalize_text(job.title), normalize_text(job.description), normalize_text(job.skills)]
         ).lower()
-        hooks = [term for term in FIT_TERM_WEIGHTS if term in text_blob][:5]
+        hooks = find_fit_terms(text_blob)[:5]
         if not hooks:
             hooks = ["data analysis", "python", "dashboarding"]
 
@@ -999,11 +1227,23 @@ class OrchestratorService:
         }
 
     def _compute_file_hash(self, file_path: Path) -> str:
-        sha = hashlib.sha1()
+        # Unchanged (mtime, size) means unchanged content; skip re-reading the file.
+        stats = file_path.stat()
+        signature = (stats.st_mtime_ns, stats.st_size)
+        cached = self._hash_cache.get(str(file_path))
+        if cached and cached[0] == signature:
+            return cached[1]
+
         with file_path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(65536), b""):
-                sha.update(chunk)
-        return sha.hexdigest()
+            if hasattr(hashlib, "file_digest"):
+                digest = hashlib.file_digest(handle, "sha1").hexdigest()
+            else:
+                sha = hashlib.sha1()
+                for chunk in iter(lambda: handle.read(65536), b""):
+                    sha.update(chunk)
+                digest = sha.hexdigest()
+        self._hash_cache[str(file_path)] = (signature, digest)
+        return digest
 
     def _parse_file(self, file_path: Path) -> Dict[str, Any]:
         if file_path.suffix.lower() == ".csv":
@@ -1013,47 +1253,65 @@ class OrchestratorService:
     def _parse_csv_file(self, file_path: Path) -> Dict[str, Any]:
         dataset = detect_dataset_from_filename(file_path)
         keyword = infer_keyword_from_path(file_path)
-        jobs: List[Dict[str, Any]] = []
-        talent: List[Dict[str, Any]] = []
-        projects: List[Dict[str, Any]] = []
+        jobs: Dict[str, Dict[str, Any]] = {}
+        talent: Dict[str, Dict[str, Any]] = {}
+        projects: Dict[str, Dict[str, Any]] = {}
 
         try:
-            with file_path.open("r", encoding="utf-8", errors="ignore", newline="") as handle:
-                reader = csv.DictReader(handle)
-                for row in reader:
-                    normalized = {str(k).strip().lower(): v for k, v in row.items() if k}
-                    record_keyword = (
-                        normalize_text(
-                            pick_first(
-                                normalized,
-                                ["keyword", "search_keyword", "query", "target_keyword"],
-                                keyword,
-                            )
-                        ).strip()
-                        or keyword
-                    )
-                    if dataset == "jobs":
-                        jobs.append(self._normalize_job_row(normalized, record_keyword))
-                    elif dataset == "talent":
-                        talent.append(self._normalize_talent_row(normalized, record_keyword))
-                    elif dataset == "projects":
-                        projects.append(
-                            self._normalize_project_row(normalized, record_keyword)
-                        )
-                    else:
-                        # mixed CSV fallback
-                        if "hourly_rate" in normalized or "jobs_completed" in normalized:
-                            talent.append(
-                                self._normalize_talent_row(normalized, record_keyword)
-                            )
-                        elif "sales" in normalized or "category" in normalized:
-                            projects.append(
-                                self._normalize_project_row(normalized, record_keyword)
-                            )
-                        else:
-                            jobs.append(self._normalize_job_row(normalized, record_keyword))
+            header = pd.read_csv(
+                file_path, nrows=0, encoding="utf-8", encoding_errors="ignore"
+            ).columns
+            # Selecting the header's columns truncates rows with extra trailing
+            # fields instead of rejecting them, as csv.DictReader did.
+            frame = pd.read_csv(
+                file_path,
+                dtype=str,
+                keep_default_na=False,
+                encoding="utf-8",
+                encoding_errors="ignore",
+                engine="c",
+                usecols=range(len(header)),
+            )
+            frame.columns = frame.columns.str.strip().str.lower()
+            frame = frame.loc[:, ~frame.columns.str.startswith("unnamed:")].fillna("")
+            record_keywords = pick_first_column(
+                frame,
+                ["keyword", "search_keyword", "query", "target_keyword"],
+                keyword,
+            ).tolist()
+
+            # Every row shares the header, so route once per file.
+            columns = set(frame.columns)
+            if dataset in {"jobs", "talent", "projects"}:
+                target = dataset
+            elif "hourly_rate" in columns or "jobs_completed" in columns:
+                target = "talent"
+            elif "sales" in columns or "category" in columns:
+                target = "projects"
+            else:
+                # mixed CSV fallback
+                target = "jobs"
+
+            # Row dicts are built one at a time instead of all up front.
+            names = frame.columns.tolist()
+            rows = zip(
+                (dict(zip(names, values)) for values in frame.itertuples(index=False, name=None)),
+                record_keywords,
+            )
+            if target == "jobs":
+                for row, kw in rows:
+                    job = self._normalize_job_row(row, kw)
+                    jobs[job["job_key"]] = job
+            elif target == "talent":
+                for row, kw in rows:
+                    profile = self._normalize_talent_row(row, kw)
+                    talent[profile["talent_key"]] = profile
+            else:
+                for row, kw in rows:
+                    project = self._normalize_project_row(row, kw)
+                    projects[project["project_key"]] = project
         except Exception:
-            return {"keyword": keyword, "jobs": [], "talent": [], "projects": []}
+            return {"keyword": keyword, "jobs": {}, "talent": {}, "projects": {}}
 
         return {
             "keyword": keyword,
@@ -1064,108 +1322,66 @@ class OrchestratorService:
 
     def _parse_json_file(self, file_path: Path) -> Dict[str, Any]:
         keyword = infer_keyword_from_path(file_path)
-        jobs: List[Dict[str, Any]] = []
-        talent: List[Dict[str, Any]] = []
-        projects: List[Dict[str, Any]] = []
+        jobs: Dict[str, Dict[str, Any]] = {}
+        talent: Dict[str, Dict[str, Any]] = {}
+        projects: Dict[str, Dict[str, Any]] = {}
 
         try:
-            payload = json.loads(file_path.read_text(encoding="utf-8", errors="ignore"))
+            payload = self._load_json_payload(file_path)
         except Exception:
-            return {"keyword": keyword, "jobs": [], "talent": [], "projects": []}
+            return {"keyword": keyword, "jobs": {}, "talent": {}, "projects": {}}
 
         if isinstance(payload, list):
             dataset = detect_dataset_from_filename(file_path)
+            items = lower_key_rows(payload)
             if dataset == "jobs":
-                jobs = [
-                    self._normalize_job_row(
-                        {str(k).lower(): v for k, v in item.items()},
-                        keyword,
-                    )
-                    for item in payload
-                    if isinstance(item, dict)
-                ]
+                for item in items:
+                    job = self._normalize_job_row(item, keyword)
+                    jobs[job["job_key"]] = job
             elif dataset == "talent":
-                talent = [
-                    self._normalize_talent_row(
-                        {str(k).lower(): v for k, v in item.items()},
-                        keyword,
-                    )
-                    for item in payload
-                    if isinstance(item, dict)
-                ]
+                for item in items:
+                    profile = self._normalize_talent_row(item, keyword)
+                    talent[profile["talent_key"]] = profile
             else:
-                projects = [
-                    self._normalize_project_row(
-                        {str(k).lower(): v for k, v in item.items()},
-                        keyword,
-                    )
-                    for item in payload
-                    if isinstance(item, dict)
-                ]
+                for item in items:
+                    project = self._normalize_project_row(item, keyword)
+                    projects[project["project_key"]] = project
             return {"keyword": keyword, "jobs": jobs, "talent": talent, "projects": projects}
 
         if isinstance(payload, dict):
             source_keyword = normalize_text(
                 payload.get("keyword") or payload.get("search_keyword") or keyword
             ).strip() or keyword
-            for item in payload.get("jobs", []):
-                if isinstance(item, dict):
-                    jobs.append(
-                        self._normalize_job_row(
-                            {str(k).lower(): v for k, v in item.items()},
-                            source_keyword,
-                        )
-                    )
-            for item in payload.get("talent", []):
-                if isinstance(item, dict):
-                    talent.append(
-                        self._normalize_talent_row(
-                            {str(k).lower(): v for k, v in item.items()},
-                            source_keyword,
-                        )
-                    )
-            for item in payload.get("projects", []):
-                if isinstance(item, dict):
-                    projects.append(
-                        self._normalize_project_row(
-                            {str(k).lower(): v for k, v in item.items()},
-                            source_keyword,
-                        )
-                    )
+            for item in lower_key_rows(payload.get("jobs", [])):
+                job = self._normalize_job_row(item, source_keyword)
+                jobs[job["job_key"]] = job
+            for item in lower_key_rows(payload.get("talent", [])):
+                profile = self._normalize_talent_row(item, source_keyword)
+                talent[profile["talent_key"]] = profile
+            for item in lower_key_rows(payload.get("projects", [])):
+                project = self._normalize_project_row(item, source_keyword)
+                projects[project["project_key"]] = project
 
         return {"keyword": keyword, "jobs": jobs, "talent": talent, "projects": projects}
 
-    def _normalize_job_row(self, row: Dict[str, Any], keyword: str) -> Dict[str, Any]:
-        title = normalize_text(pick_first(row, ["title", "job_title"], "Untitled job")).strip()
-        description = normalize_text(
-            pick_first(
-                row,
-                [
-                    "description",
-                    "snippet",
-                    "summary",
-                    "detail_summary",
-                    "detail_description",
-                    "overview",
-                ],
-                "",
-            )
-        )
-        signal_map = [
-            ("job_availability", ["detail_job_availability"]),
-            ("posted", ["detail_posted", "posted", "posted_date"]),
-            ("activity_last_viewed", ["detail_activity_last_viewed"]),
-            ("activity_interviewing", ["detail_activity_interviewing"]),
-            ("activity_invites_sent", ["detail_activity_invites_sent"]),
-            ("activity_unanswered_invites", ["detail_activity_unanswered_invites"]),
-            ("activity_proposals", ["detail_activity_proposals"]),
-            ("client_hire_rate", ["detail_client_hire_rate"]),
-            ("client_jobs_posted", ["detail_client_jobs_posted"]),
-            ("client_open_jobs", ["detail_client_open_jobs"]),
-            ("client_member_since", ["detail_client_member_since"]),
-        ]
+    @staticmethod
+    def _load_json_payload(file_path: Path) -> Any:
+        # orjson parses straight from the mapped bytes (no decoded str copy).
+        # Invalid UTF-8 falls back to a lossy decode, like the old read_text(errors="ignore").
+        with file_path.open("rb") as handle, mmap.mmap(
+            handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer, memoryview(buffer) as view:
+            try:
+                return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                return orjson.loads(bytes(view).decode("utf-8", errors="ignore"))
+
+    def _normalize_job_row(self, row: Mapping[str, Any], keyword: str) -> Dict[str, Any]:
+        keys = JOB_FIELD_KEYS
+        title = normalize_text(pick_first(row, keys["title"], "Untitled job")).strip()
+        description = normalize_text(pick_first(row, keys["description"], ""))
         signal_lines = []
-        for label, aliases in signal_map:
+        for label, aliases in JOB_SIGNAL_KEYS:
             value = normalize_text(pick_first(row, aliases, "")).strip()
             if value:
                 signal_lines.append(f"{label}: {value}")
@@ -1173,40 +1389,18 @@ class OrchestratorService:
             description = (
                 f"{description}\n\n[market_signals]\n" + "\n".join(signal_lines)
             ).strip()
-        url = normalize_text(
-            pick_first(row, ["url", "job_url", "detail_job_url", "detail_url"], "")
-        ).strip()
-        budget = normalize_text(
-            pick_first(row, ["budget", "hourly_rate", "price", "payment"], "")
-        ).strip()
-        client_spend = parse_money_value(
-            pick_first(row, ["client_spend", "spent", "client_total_spent"], None)
-        )
-        payment_verified = parse_bool_value(
-            pick_first(
-                row,
-                [
-                    "payment_verified",
-                    "client_payment_verified",
-                    "is_payment_verified",
-                ],
-                False,
-            )
-        )
-        proposals = pick_first(row, ["proposals", "proposal_count", "bids"], None)
-        skills = normalize_text(pick_first(row, ["skills", "skill_tags", "tags"], ""))
+        url = normalize_text(pick_first(row, keys["url"], "")).strip()
+        budget = normalize_text(pick_first(row, keys["budget"], "")).strip()
+        client_spend = parse_money_value(pick_first(row, keys["client_spend"], None))
+        payment_verified = parse_bool_value(pick_first(row, keys["payment_verified"], False))
+        proposals = pick_first(row, keys["proposals"], None)
+        skills = normalize_text(pick_first(row, keys["skills"], ""))
         record_keyword = (
-            normalize_text(
-                pick_first(row, ["keyword", "search_keyword", "query"], keyword)
-            ).strip()
+            normalize_text(pick_first(row, keys["keyword"], keyword)).strip()
             or keyword
         )
-        scraped_at = self._parse_datetime(
-            pick_first(row, ["scraped_at", "timestamp", "created_at"], None)
-        )
-        posted_at = self._parse_datetime(
-            pick_first(row, ["detail_posted", "posted", "posted_date"], None)
-        )
+        scraped_at = self._parse_datetime(pick_first(row, keys["scraped_at"], None))
+        posted_at = self._parse_datetime(pick_first(row, keys["posted_at"], None))
 
         return {
             "job_key": derive_job_key(url, title, record_keyword),
@@ -1220,28 +1414,24 @@ class OrchestratorService:
             "payment_verified": payment_verified,
             "proposals": normalize_text(proposals) if proposals is not None else None,
             "skills": skills,
+            "fit_blob": build_fit_blob(title, description, skills, record_keyword),
             "scraped_at": scraped_at,
             "posted_at": posted_at,
         }
 
-    def _normalize_talent_row(self, row: Dict[str, Any], keyword: str) -> Dict[str, Any]:
-        name = normalize_text(pick_first(row, ["name", "full_name"], "")).strip()
-        title = normalize_text(pick_first(row, ["title", "headline"], "")).strip()
-        description = normalize_text(
-            pick_first(row, ["description", "overview", "bio", "summary"], "")
-        )
-        url = normalize_text(
-            pick_first(row, ["url", "profile_url", "detail_profile_url"], "")
-        ).strip()
-        hourly_rate = normalize_text(pick_first(row, ["hourly_rate", "rate", "price"], ""))
-        skills = normalize_text(pick_first(row, ["skills", "tags"], ""))
+    def _normalize_talent_row(self, row: Mapping[str, Any], keyword: str) -> Dict[str, Any]:
+        keys = TALENT_FIELD_KEYS
+        name = normalize_text(pick_first(row, keys["name"], "")).strip()
+        title = normalize_text(pick_first(row, keys["title"], "")).strip()
+        description = normalize_text(pick_first(row, keys["description"], ""))
+        url = normalize_text(pick_first(row, keys["url"], "")).strip()
+        hourly_rate = normalize_text(pick_first(row, keys["hourly_rate"], ""))
+        skills = normalize_text(pick_first(row, keys["skills"], ""))
         record_keyword = (
-            normalize_text(pick_first(row, ["keyword", "search_keyword"], keyword)).strip()
+            normalize_text(pick_first(row, keys["keyword"], keyword)).strip()
             or keyword
         )
-        scraped_at = self._parse_datetime(
-            pick_first(row, ["scraped_at", "timestamp", "created_at"], None)
-        )
+        scraped_at = self._parse_datetime(pick_first(row, keys["scraped_at"], None))
 
         return {
             "talent_key": derive_talent_key(url, name or title, record_keyword),
@@ -1253,185 +1443,189 @@ class OrchestratorService:
             "hourly_rate": hourly_rate,
             "hourly_rate_value": parse_money_value(hourly_rate),
             "skills": skills,
-            "country": normalize_text(pick_first(row, ["country", "location"], "")),
-            "rating": self._parse_float(pick_first(row, ["rating", "score"], None)),
-            "jobs_completed": parse_int_value(pick_first(row, ["jobs_completed", "jobs"], None)),
+            "country": normalize_text(pick_first(row, keys["country"], "")),
+            "rating": self._parse_float(pick_first(row, keys["rating"], None)),
+            "jobs_completed": parse_int_value(pick_first(row, keys["jobs_completed"], None)),
             "scraped_at": scraped_at,
         }
 
-    def _normalize_project_row(self, row: Dict[str, Any], keyword: str) -> Dict[str, Any]:
-        title = normalize_text(pick_first(row, ["title", "project_title"], "Untitled project"))
-        description = normalize_text(
-            pick_first(row, ["description", "summary", "detail_project_description"], "")
-        )
-        url = normalize_text(
-            pick_first(row, ["url", "project_url", "detail_project_url"], "")
-        ).strip()
-        price = normalize_text(pick_first(row, ["price", "budget"], ""))
+    def _normalize_project_row(self, row: Mapping[str, Any], keyword: str) -> Dict[str, Any]:
+        keys = PROJECT_FIELD_KEYS
+        title = normalize_text(pick_first(row, keys["title"], "Untitled project"))
+        description = normalize_text(pick_first(row, keys["description"], ""))
+        url = normalize_text(pick_first(row, keys["url"], "")).strip()
+        price = normalize_text(pick_first(row, keys["price"], ""))
         record_keyword = (
-            normalize_text(pick_first(row, ["keyword", "search_keyword"], keyword)).strip()
+            normalize_text(pick_first(row, keys["keyword"], keyword)).strip()
             or keyword
         )
-        scraped_at = self._parse_datetime(
-            pick_first(row, ["scraped_at", "timestamp", "created_at"], None)
-        )
+        scraped_at = self._parse_datetime(pick_first(row, keys["scraped_at"], None))
         return {
             "project_key": derive_project_key(url, title, record_keyword),
             "keyword": record_keyword,
             "title": title,
             "description": description,
             "url": url,
-            "category": normalize_text(pick_first(row, ["category", "service_category"], "")),
+            "category": normalize_text(pick_first(row, keys["category"], "")),
             "price": price,
             "price_value": parse_money_value(price),
-            "rating": self._parse_float(pick_first(row, ["rating", "score"], None)),
-            "sales": parse_int_value(pick_first(row, ["sales", "orders"], None)),
+            "rating": self._parse_float(pick_first(row, keys["rating"], None)),
+            "sales": parse_int_value(pick_first(row, keys["sales"], None)),
             "scraped_at": scraped_at,
         }
 
-    def _upsert_jobs(self, db: Session, records: List[Dict[str, Any]], source_file: str) -> None:
-        unique_rows: Dict[str, Dict[str, Any]] = {}
-        for row in records:
-            key = normalize_text(row.get("job_key")).strip()
-            if not key:
-                continue
-            unique_rows[key] = row
-        if not unique_rows:
+    def _upsert_jobs(
+        self, db: Session, records: Dict[str, Dict[str, Any]], source_file: str
+    ) -> None:
+        """Upsert parsed rows, already deduplicated by job_key during parsing."""
+        if not records:
             return
+        rows = [
+            {**row, "title": row["title"] or "Untitled job", "payment_verified": bool(row["payment_verified"])}
+            for row in records.values()
+        ]
+        if not self._bulk_upsert(db, JobRaw, "job_key", rows, source_file):
+            self._merge_rows(db, JobRaw, "job_key", rows, source_file)
+
+    def _upsert_talent(
+        self, db: Session, records: Dict[str, Dict[str, Any]], source_file: str
+    ) -> None:
+        """Upsert parsed rows, already deduplicated by talent_key during parsing."""
+        if not records:
+            return
+        rows = list(records.values())
+        if not self._bulk_upsert(db, TalentRaw, "talent_key", rows, source_file):
+            self._merge_rows(db, TalentRaw, "talent_key", rows, source_file)
+
+    def _upsert_projects(
+        self, db: Session, records: Dict[str, Dict[str, Any]], source_file: str
+    ) -> None:
+        """Upsert parsed rows, already deduplicated by project_key during parsing."""
+        if not records:
+            return
+        rows = list(records.values())
+        if not self._bulk_upsert(db, ProjectRaw, "project_key", rows, source_file):
+            self._merge_rows(db, ProjectRaw, "project_key", rows, source_file)
 
-        keys = list(unique_rows.keys())
-        existing = (
-            db.query(JobRaw)
-            .filter(JobRaw.job_key.in_(keys))
-            .all()
-        )
-        existing_map = {item.job_key: item for item in existing}
+    @staticmethod
+    def _bulk_upsert(
+        db: Session,
+        model: Any,
+        key_field: str,
+        rows: List[Dict[str, Any]],
+        source_file: str,
+    ) -> bool:
+        """Upsert rows with INSERT ... ON CONFLICT DO UPDATE.
+
+        Rows with a scraped_at only overwrite an existing entry when it is newer.
+        Rows without one are stamped with the ingest time on insert, and on
+        conflict refresh the other columns but keep the stored scraped_at.
+        posted_at is kept when the incoming row has none. Returns False when the
+        dialect has no ON CONFLICT support so the caller can fall back to
+        _merge_rows.
+        """
+        insert_fn = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if insert_fn is None:
+            return False
 
-        for key, row in unique_rows.items():
-            entry = existing_map.get(key)
-            if not entry:
-                entry = JobRaw(job_key=key, title=row["title"] or "Untitled job")
-                db.add(entry)
-                existing_map[key] = entry
-            changed = False
-            changed = self._set_if_changed(entry, "keyword", row["keyword"]) or changed
-            changed = self._set_if_changed(entry, "title", row["title"] or "Untitled job") or changed
-            changed = self._set_if_changed(entry, "description", row["description"]) or changed
-            changed = self._set_if_changed(entry, "url", row["url"]) or changed
-            changed = self._set_if_changed(entry, "budget", row["budget"]) or changed
-            changed = self._set_if_changed(entry, "budget_value", row["budget_value"]) or changed
-            changed = self._set_if_changed(entry, "client_spend", row["client_spend"]) or changed
-            changed = self._set_if_changed(entry, "payment_verified", bool(row["payment_verified"])) or changed
-            changed = self._set_if_changed(entry, "proposals", row["proposals"]) or changed
-            changed = self._set_if_changed(entry, "skills", row["skills"]) or changed
-            changed = self._set_if_changed(entry, "source_file", source_file) or changed
-            if row.get("posted_at"):
-                changed = self._set_if_changed(entry, "posted_at", row["posted_at"]) or changed
-
-            new_scraped_at = row["scraped_at"] or entry.scraped_at or datetime.utcnow()
-            if entry.scraped_at is None or (new_scraped_at and new_scraped_at > entry.scraped_at):
-                entry.scraped_at = new_scraped_at
-                changed = True
-
-            if changed:
-                entry.scraped_at = entry.scraped_at or datetime.utcnow()
-
-    def _upsert_talent(self, db: Session, records: List[Dict[str, Any]], source_file: str) -> None:
-        unique_rows: Dict[str, Dict[str, Any]] = {}
-        for row in records:
-            key = normalize_text(row.get("talent_key")).strip()
-            if not key:
-                continue
-            unique_rows[key] = row
-        if not unique_rows:
-            return
+        table = model.__table__
+        now = datetime.utcnow()
+        columns = [col.name for col in table.c if col.name != "id"]
+        stamped: List[Dict[str, Any]] = []
+        unstamped: List[Dict[str, Any]] = []
+        for row in rows:
+            values = {name: row.get(name) for name in columns}
+            values["source_file"] = source_file
+            if values["scraped_at"]:
+                stamped.append(values)
+            else:
+                values["scraped_at"] = now
+                unstamped.append(values)
 
-        keys = list(unique_rows.keys())
-        existing = (
-            db.query(TalentRaw)
-            .filter(TalentRaw.talent_key.in_(keys))
-            .all()
-        )
-        existing_map = {item.talent_key: item for item in existing}
+        stmt = insert_fn(table)
+        update_set = {
+            name: stmt.excluded[name] for name in columns if name != key_field
+        }
+        if "posted_at" in update_set:
+            update_set["posted_at"] = func.coalesce(stmt.excluded.posted_at, table.c.posted_at)
+        if stamped:
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[key_field],
+                    set_=update_set,
+                    where=or_(
+                        table.c.scraped_at.is_(None),
+                        stmt.excluded.scraped_at > table.c.scraped_at,
+                    ),
+                ),
+                stamped,
+            )
+        if unstamped:
+            keep_scraped_at = {
+                **update_set,
+                "scraped_at": func.coalesce(table.c.scraped_at, stmt.excluded.scraped_at),
+            }
+            db.execute(
+                stmt.on_conflict_do_update(index_elements=[key_field], set_=keep_scraped_at),
+                unstamped,
+            )
+        return True
 
-        for key, row in unique_rows.items():
-            entry = existing_map.get(key)
-            if not entry:
-                entry = TalentRaw(talent_key=key)
-                db.add(entry)
-                existing_map[key] = entry
-            changed = False
-            changed = self._set_if_changed(entry, "keyword", row["keyword"]) or changed
-            changed = self._set_if_changed(entry, "name", row["name"]) or changed
-            changed = self._set_if_changed(entry, "title", row["title"]) or changed
-            changed = self._set_if_changed(entry, "description", row["description"]) or changed
-            changed = self._set_if_changed(entry, "url", row["url"]) or changed
-            changed = self._set_if_changed(entry, "hourly_rate", row["hourly_rate"]) or changed
-            changed = self._set_if_changed(entry, "hourly_rate_value", row["hourly_rate_value"]) or changed
-            changed = self._set_if_changed(entry, "skills", row["skills"]) or changed
-            changed = self._set_if_changed(entry, "country", row["country"]) or changed
-            changed = self._set_if_changed(entry, "rating", row["rating"]) or changed
-            changed = self._set_if_changed(entry, "jobs_completed", row["jobs_completed"]) or changed
-            changed = self._set_if_changed(entry, "source_file", source_file) or changed
-
-            new_scraped_at = row["scraped_at"] or entry.scraped_at or datetime.utcnow()
-            if entry.scraped_at is None or (new_scraped_at and new_scraped_at > entry.scraped_at):
-                entry.scraped_at = new_scraped_at
-                changed = True
-
-            if changed:
-                entry.scraped_at = entry.scraped_at or datetime.utcnow()
-
-    def _upsert_projects(self, db: Session, records: List[Dict[str, Any]], source_file: str) -> None:
-        unique_rows: Dict[str, Dict[str, Any]] = {}
-        for row in records:
-            key = normalize_text(row.get("project_key")).strip()
-            if not key:
+    @staticmethod
+    def _merge_rows(
+        db: Session,
+        model: Any,
+        key_field: str,
+        rows: List[Dict[str, Any]],
+        source_file: str,
+    ) -> None:
+        """Portable upsert for dialects without ON CONFLICT.
+
+        Loads the stored columns in one SELECT, diffs in Python, then sends new
+        rows as one executemany INSERT and changed rows as one executemany
+        UPDATE keyed by primary key. Matches _bulk_upsert: rows whose scraped_at
+        is not newer than the stored one are skipped; otherwise incoming values
+        overwrite stored ones, except that posted_at is only replaced when
+        provided and a row without scraped_at keeps the stored one.
+        """
+        table = model.__table__
+        columns = [col.name for col in table.c if col.name not in ("id", key_field)]
+        keys = [row[key_field] for row in rows]
+        lookup = select(table).where(table.c[key_field].in_(bindparam("keys", expanding=True)))
+        existing: Dict[str, Any] = {}
+        # Bounded IN lists keep statement size and bind-parameter counts in check.
+        for start in range(0, len(keys), KEY_LOOKUP_BATCH):
+            for stored in db.execute(lookup, {"keys": keys[start:start + KEY_LOOKUP_BATCH]}).mappings():
+                existing[stored[key_field]] = stored
+
+        now = datetime.utcnow()
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        for row in rows:
+            values = {name: row.get(name) for name in columns}
+            values["source_file"] = source_file
+            stored = existing.get(row[key_field])
+            if stored is None:
+                values[key_field] = row[key_field]
+                values["scraped_at"] = values["scraped_at"] or now
+                inserts.append(values)
                 continue
-            unique_rows[key] = row
-        if not unique_rows:
-            return
 
-        keys = list(unique_rows.keys())
-        existing = (
-            db.query(ProjectRaw)
-            .filter(ProjectRaw.project_key.in_(keys))
-            .all()
-        )
-        existing_map = {item.project_key: item for item in existing}
+            # Re-ingesting the same scrape is the common case: nothing to diff.
+            incoming_scraped_at = values["scraped_at"]
+            if incoming_scraped_at and stored["scraped_at"] and incoming_scraped_at <= stored["scraped_at"]:
+                continue
 
-        for key, row in unique_rows.items():
-            entry = existing_map.get(key)
-            if not entry:
-                entry = ProjectRaw(project_key=key)
-                db.add(entry)
-                existing_map[key] = entry
-            changed = False
-            changed = self._set_if_changed(entry, "keyword", row["keyword"]) or changed
-            changed = self._set_if_changed(entry, "title", row["title"]) or changed
-            changed = self._set_if_changed(entry, "description", row["description"]) or changed
-            changed = self._set_if_changed(entry, "url", row["url"]) or changed
-            changed = self._set_if_changed(entry, "category", row["category"]) or changed
-            changed = self._set_if_changed(entry, "price", row["price"]) or changed
-            changed = self._set_if_changed(entry, "price_value", row["price_value"]) or changed
-            changed = self._set_if_changed(entry, "rating", row["rating"]) or changed
-            changed = self._set_if_changed(entry, "sales", row["sales"]) or changed
-            changed = self._set_if_changed(entry, "source_file", source_file) or changed
-
-            new_scraped_at = row["scraped_at"] or entry.scraped_at or datetime.utcnow()
-            if entry.scraped_at is None or (new_scraped_at and new_scraped_at > entry.scraped_at):
-                entry.scraped_at = new_scraped_at
-                changed = True
-
-            if changed:
-                entry.scraped_at = entry.scraped_at or datetime.utcnow()
+            if "posted_at" in values and not values["posted_at"]:
+                values["posted_at"] = stored["posted_at"]
+            values["scraped_at"] = incoming_scraped_at or stored["scraped_at"] or now
+            if any(values[name] != stored[name] for name in values):
+                updates.append({"id": stored["id"], **values})
 
-    @staticmethod
-    def _set_if_changed(entry: Any, field: str, value: Any) -> bool:
-        if getattr(entry, field) == value:
-            return False
-        setattr(entry, field, value)
-        return True
+        if inserts:
+            db.execute(insert(model), inserts)
+        if updates:
+            db.execute(update(model), updates)
 
     def _parse_datetime(self, value: Any) -> Optional[datetime]:
         if value is None or value == "":
@@ -1442,15 +1636,11 @@ class OrchestratorService:
         if not text:
             return None
 
-        # Try ISO format first
-        for candidate in (
-            text,
-            text.replace("Z", "+00:00"),
-        ):
-            try:
-                return datetime.fromisoformat(candidate)
-            except ValueError:
-                continue
+        # Try ISO format first (ciso8601 handles both "Z" and "+00:00" offsets in C).
+        try:
+            return ciso8601.parse_datetime(text)
+        except ValueError:
+            pass
 
         # Parse Upwork's relative date strings ("Posted 2 hours ago", "3 days ago", etc.)
         text_lower = text.lower()
@@ -1487,16 +1677,33 @@ class OrchestratorService:
             return None
         if isinstance(value, (int, float)):
             return float(value)
-        match = re.search(r"\d+(?:\.\d+)?", str(value))
+        match = _FLOAT_RE.search(str(value))
         if not match:
             return None
         return float(match.group(0))
 
+    def _commit(self, db: Session) -> None:
+        db.commit()
+        self._mutation_epoch += 1
+
+    def _cached_status(
+        self, cached: Optional[Tuple[int, float, Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        if cached is None:
+            return None
+        epoch, stamp, result = cached
+        if epoch != self._mutation_epoch or time.monotonic() - stamp >= STATUS_CACHE_TTL_SECONDS:
+            return None
+        return dict(result)
+
     def _log_event(self, db: Session, event_type: str, payload: Dict[str, Any]) -> None:
-        db.add(
-            PipelineEvent(
-                event_type=event_type,
-                payload=json.dumps(payload, ensure_ascii=False),
-                created_at=datetime.utcnow(),
-            )
+        # Rides the caller's transaction so the event commits (or rolls back)
+        # with the write it describes, under the same write lock.
+        db.execute(
+            insert(PipelineEvent),
+            {
+                "event_type": event_type,
+                "payload": _dumps(payload),
+                "created_at": datetime.utcnow(),
+            },
         )
@@ -0,0 +1,39 @@
+import unittest
+
+from upwork_scraper import JobListing, ScraperConfig, UpworkScraper
+
+
+class SearchCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.scraper = UpworkScraper(ScraperConfig(cache_ttl=300))
+        self.fetches = 0
+
+        async def iter_jobs(keyword, max_pages=None, filters=None):
+            self.fetches += 1
+            yield JobListing(title="ETL", url="https://www.upwork.com/jobs/~01",
+                             description="", skills=["python"])
+
+        self.scraper.iter_jobs = iter_jobs
+
+    async def test_cache_hit_is_not_changed_by_caller_edits(self):
+        first = await self.scraper.search_jobs("data", max_pages=1)
+        first[0].title = "edited"
+        first[0].skills.append("edited")
+        first.clear()
+
+        second = await self.scraper.search_jobs("data", max_pages=1)
+        second[0].skills.append("edited again")
+        third = await self.scraper.search_jobs("data", max_pages=1)
+
+        self.assertEqual(self.fetches, 1)
+        self.assertEqual([(job.title, job.skills) for job in third], [("ETL", ["python"])])
+        self.assertIsNot(second[0], third[0])
+
+    async def test_refresh_bypasses_the_cache(self):
+        await self.scraper.search_jobs("data", max_pages=1)
+        await self.scraper.search_jobs("data", max_pages=1, refresh=True)
+        self.assertEqual(self.fetches, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,18 +12,29 @@ Author: Upwork Extension Team
 License: MIT
 """
 
+import array
 import asyncio
+import hashlib
+import io
 import logging
 import json
+import os
+import random
 import re
-from typing import Dict, List, Optional, Any
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Any
+from contextlib import asynccontextmanager
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from urllib.parse import urljoin, quote, urlencode
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass, replace
+from urllib.parse import urljoin, quote, urlencode, urlparse
 
 try:
     from playwright.async_api import async_playwright, Browser, Page, BrowserContext
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError as e:
     raise ImportError(
         "Required dependencies missing. Install with:\n"
@@ -31,6 +42,260 @@ except ImportError as e:
         "playwright install chromium"
     ) from e
 
+try:
+    from lxml import etree
+    _PARSER = "lxml"
+except ImportError:
+    etree = None
+    _PARSER = "html.parser"
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Bump whenever card parsing changes, so parse cache entries from older code are ignored.
+_PARSER_VERSION = 1
+
+# Patterns used for every card; compiled once here rather than per call.
+_NUMBER_RE = re.compile(r'[\d,]+\.?\d*')
+_INT_RE = re.compile(r'\d+')
+_DECIMAL_RE = re.compile(r'\d+\.?\d*')
+_EMBEDDED_JSON_RES = tuple(
+    re.compile(pattern, re.DOTALL)
+    for pattern in (
+        r'<script\s+type="application/ld\+json">(.*?)</script>',
+        r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
+        r'__UPWORK__\s*=\s*({.*?});',
+    )
+)
+
+# Markers of a CAPTCHA or block page, matched case-insensitively
+_BLOCKED_MARKERS = ("captcha", "access denied")
+
+if hyperscan is not None:
+    # One compiled automaton finds any marker in a single pass over the page
+    _BLOCKED_DB = hyperscan.Database()
+    _BLOCKED_DB.compile(
+        expressions=[marker.encode() for marker in _BLOCKED_MARKERS],
+        ids=list(range(len(_BLOCKED_MARKERS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_BLOCKED_MARKERS),
+    )
+else:
+    _BLOCKED_DB = None
+
+
+def _is_blocked_page(content: str) -> bool:
+    """Check page HTML for CAPTCHA / access-denied markers."""
+    if _BLOCKED_DB is not None:
+        found = []
+        _BLOCKED_DB.scan(
+            content.encode('utf-8', 'surrogatepass'),
+            match_event_handler=lambda id, start, end, flags, context: found.append(id),
+        )
+        return bool(found)
+    lowered = content.lower()
+    return any(marker in lowered for marker in _BLOCKED_MARKERS)
+
+
+def _has_class(name: str) -> Callable[[Any], bool]:
+    """Strainer test for one CSS class (the attribute may not be split into a list yet)."""
+    def test(value: Any) -> bool:
+        if not value:
+            return False
+        return name in (value.split() if isinstance(value, str) else value)
+    return test
+
+
+def _href_contains(part: str) -> Callable[[Any], bool]:
+    """find() test for an href containing part (the CSS a[href*="..."])."""
+    def test(value: Any) -> bool:
+        return value is not None and part in value
+    return test
+
+
+_JOB_HREF = _href_contains("/jobs/")
+_PROFILE_HREF = _href_contains("/profile/")
+_PROJECT_HREF = _href_contains("/projects/")
+
+
+# Card selectors in priority order, each paired with a strainer so the page is
+# parsed only for that card shape instead of building the whole DOM.
+_JOB_CARD_SCOPES = (
+    ('[data-qa="job-tile"]', SoupStrainer(attrs={"data-qa": "job-tile"})),
+    ('.job-tile', SoupStrainer(class_=_has_class("job-tile"))),
+    ('section[data-test="JobTile"]', SoupStrainer("section", attrs={"data-test": "JobTile"})),
+)
+_TALENT_CARD_SCOPES = (
+    ('[data-qa="talent-tile"]', SoupStrainer(attrs={"data-qa": "talent-tile"})),
+    ('.talent-tile', SoupStrainer(class_=_has_class("talent-tile"))),
+    ('article[data-test="FreelancerTile"]', SoupStrainer("article", attrs={"data-test": "FreelancerTile"})),
+)
+_PROJECT_CARD_SCOPES = (
+    ('[data-qa="project-tile"]', SoupStrainer(attrs={"data-qa": "project-tile"})),
+    ('.project-tile', SoupStrainer(class_=_has_class("project-tile"))),
+    ('article[class*="project"]', SoupStrainer("article", class_=re.compile("project"))),
+)
+
+
+# The same job card shapes as element tests, for streaming with lxml.iterparse.
+_JOB_CARD_TESTS = (
+    lambda elem: elem.get("data-qa") == "job-tile",
+    lambda elem: "job-tile" in (elem.get("class") or "").split(),
+    lambda elem: elem.tag == "section" and elem.get("data-test") == "JobTile",
+)
+
+
+# Reads job cards inside the browser with the same selectors and fallbacks as
+# _JOB_CARD_SCOPES and _parse_job_card, returning only the raw field text that
+# _job_from_fields needs. When no card has a title it returns the embedded JSON
+# documents instead: JSON-LD script bodies and the live app state objects, read
+# directly rather than regex-scraped out of the HTML.
+_JOB_CARDS_JS = """
+() => {
+    const html = document.documentElement.outerHTML;
+    if (/captcha|access denied/i.test(html)) {
+        return {blocked: true, cards: [], embedded: []};
+    }
+
+    // Text nodes joined like BeautifulSoup's get_text(); strip trims each one
+    const skipped = new Set(["SCRIPT", "STYLE", "TEMPLATE", "RT", "RP"]);
+    const text = (el, strip = true) => {
+        let out = "";
+        const walk = (node) => {
+            for (const child of node.childNodes) {
+                if (child.nodeType === Node.TEXT_NODE) {
+                    out += strip ? child.nodeValue.trim() : child.nodeValue;
+                } else if (child.nodeType === Node.ELEMENT_NODE && !skipped.has(child.tagName)) {
+                    walk(child);
+                }
+            }
+        };
+        walk(el);
+        return out;
+    };
+    const first = (root, selectors) => {
+        for (const selector of selectors) {
+            const el = root.querySelector(selector);
+            if (el) return el;
+        }
+        return null;
+    };
+    const all = (root, selectors) => {
+        for (const selector of selectors) {
+            const els = root.querySelectorAll(selector);
+            if (els.length) return Array.from(els);
+        }
+        return [];
+    };
+
+    const tiles = all(document, ['[data-qa="job-tile"]', '.job-tile', 'section[data-test="JobTile"]']);
+    const cards = tiles.map((card) => {
+        const title = first(card, ['[data-qa="job-title"]', 'h3', '.job-title']);
+        const link = first(card, ['a[href*="/jobs/"]', 'a[data-qa="job-title-link"]']);
+        const desc = first(card, ['[data-qa="job-description"]', '.job-description']);
+        const budget = first(card, ['[data-qa="job-type"]', '.budget']);
+        const spent = first(card, ['[data-qa="client-spent"]', '.client-spent']);
+        const proposals = first(card, ['[data-qa="proposal-count"]', '.proposals']);
+        return {
+            title: title ? text(title) : "",
+            href: link ? link.getAttribute("href") : null,
+            description: desc ? text(desc) : "",
+            budget: budget ? text(budget) : null,
+            skills: all(card, ['[data-qa="skill"]', '.skill-pill']).slice(0, 10).map((el) => text(el)),
+            client_verified: card.querySelector('[data-qa="client-verified"]') !== null,
+            client_payment_verified: card.querySelector('[data-qa="client-payment-verified"]') !== null,
+            client_spent: spent ? text(spent) : null,
+            proposals: proposals ? text(proposals, false) : null,
+        };
+    });
+    if (cards.some((card) => card.title)) {
+        return {blocked: false, cards, embedded: []};
+    }
+
+    const embedded = Array.from(
+        document.querySelectorAll('script[type="application/ld+json"]'), (script) => script.textContent
+    );
+    for (const name of ["__INITIAL_STATE__", "__UPWORK__"]) {
+        try {
+            if (window[name]) embedded.push(JSON.stringify(window[name]));
+        } catch (e) {
+            // not serializable (e.g. circular); skip it
+        }
+    }
+    return {blocked: false, cards, embedded};
+}
+"""
+
+
+def _stream_job_cards(content: str) -> Iterator[Any]:
+    """
+    Yield job cards from a single lxml.iterparse pass over the page.
+
+    Each element is tested against every _JOB_CARD_TESTS shape as it opens and
+    is cleared once it closes outside a card, so the parsed page never piles
+    up. A closed card is serialized and re-parsed as its own small soup for
+    _parse_job_card. Shapes keep the priority order of _JOB_CARD_SCOPES: cards
+    of the first shape are yielded as they close, while fallback-shape cards
+    are held as HTML until the page turns out to have no higher-priority
+    cards. Like the strainers, a card nested in a card of the same shape is
+    part of the outer one.
+    """
+    best = len(_JOB_CARD_TESTS)  # highest-priority shape seen so far
+    held: List[Tuple[str, str]] = []  # (tag, html) of shape `best` cards while best > 0
+    open_cards: Dict[int, Any] = {}  # shape -> outermost card still being parsed
+    events = etree.iterparse(
+        io.BytesIO(content.encode("utf-8")), events=("start", "end"), html=True, encoding="utf-8"
+    )
+    for event, elem in events:
+        if not isinstance(elem.tag, str):
+            continue
+        if event == "start":
+            for shape, is_card in enumerate(_JOB_CARD_TESTS[:best + 1]):
+                if shape not in open_cards and is_card(elem):
+                    open_cards[shape] = elem
+            continue
+
+        shapes = [shape for shape, card in open_cards.items() if card is elem]
+        for shape in shapes:
+            del open_cards[shape]
+        if shapes and min(shapes) <= best:
+            if min(shapes) < best:
+                best = min(shapes)
+                held.clear()
+                open_cards = {shape: card for shape, card in open_cards.items() if shape <= best}
+            fragment = etree.tostring(elem, encoding="unicode", method="html", with_tail=False)
+            if best == 0:
+                yield BeautifulSoup(fragment, _PARSER).find(elem.tag)
+            else:
+                held.append((elem.tag, fragment))
+        if not open_cards:
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    for tag, fragment in held:
+        yield BeautifulSoup(fragment, _PARSER).find(tag)
+
+
+def _select_cards(content: str, scopes) -> List[Any]:
+    """
+    Return the cards for the first card shape in scopes that matches anything.
+
+    The strainer keeps only matching subtrees, so the cards are simply the
+    top-level tags of the strained soup; no CSS selector has to run over it.
+    """
+    for _selector, strainer in scopes:
+        cards = BeautifulSoup(content, _PARSER, parse_only=strainer).find_all(True, recursive=False)
+        if cards:
+            return cards
+    return []
+
 
 # =============================================================================
 # LOGGING CONFIGURATION
@@ -47,7 +312,28 @@ logger = logging.getLogger(__name__)
 # DATA MODELS
 # =============================================================================
 
-@dataclass
+def _intern(value: Any) -> Any:
+    """Share one str object for values that repeat across many records."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _record_fields(item: Any) -> Dict:
+    """A record's fields as a plain dict that rebuilds it via type(item)(**fields)."""
+    fields = item.to_dict()
+    del fields['scraped_at']  # stamped on export, not part of the parsed record
+    return fields
+
+
+def _copy_records(items: List[Any]) -> List[Any]:
+    """
+    Fresh copies of cached records, so a caller editing one can't change the cache.
+
+    replace() re-runs __post_init__, which rebuilds the list fields as new lists.
+    """
+    return [replace(item) for item in items]
+
+
+@dataclass(slots=True)
 class JobListing:
     """Represents a job listing from Upwork."""
 
@@ -71,16 +357,63 @@ class JobListing:
     remote: bool = False
 
     def __post_init__(self):
-        if self.skills is None:
-            self.skills = []
-
-    def to_dict(self) -> Dict:
-        data = asdict(self)
-        data['scraped_at'] = datetime.now().isoformat()
-        return data
-
+        self.skills = [_intern(skill) for skill in self.skills] if self.skills else []
+        self.job_type = _intern(self.job_type)
+        self.duration = _intern(self.duration)
+
+    def to_dict(self, scraped_at: Optional[str] = None) -> Dict:
+        return {
+            'title': self.title,
+            'url': self.url,
+            'description': self.description,
+            'budget': self.budget,
+            'budget_min': self.budget_min,
+            'budget_max': self.budget_max,
+            'job_type': self.job_type,
+            'duration': self.duration,
+            'skills': list(self.skills),
+            'client_verified': self.client_verified,
+            'client_payment_verified': self.client_payment_verified,
+            'client_spent': self.client_spent,
+            'client_hires': self.client_hires,
+            'posted_date': self.posted_date,
+            'proposals_count': self.proposals_count,
+            'interviewing': self.interviewing,
+            'invites_sent': self.invites_sent,
+            'remote': self.remote,
+            'scraped_at': scraped_at or datetime.now().isoformat(timespec="seconds"),
+        }
+
+    @staticmethod
+    def to_columns(jobs: List["JobListing"]) -> Dict[str, Any]:
+        """
+        Transpose jobs into columns in a single pass, for analysis code.
 
-@dataclass
+        budget_max is a float64 array with NaN where the budget is unknown and
+        remote is a bool array; job_type and skills stay Python lists. Needs
+        numpy, which the scraper itself does not.
+        """
+        import numpy as np
+
+        budget_max = array.array('d')
+        job_type: List[Optional[str]] = []
+        skills: List[List[str]] = []
+        remote = bytearray()
+        nan = float('nan')
+        for job in jobs:
+            budget_max.append(nan if job.budget_max is None else job.budget_max)
+            job_type.append(job.job_type)
+            skills.append(job.skills)
+            remote.append(job.remote)
+        return {
+            'budget_max': np.frombuffer(budget_max, dtype=np.float64),
+            'job_type': job_type,
+            'skills': skills,
+            'remote': np.frombuffer(remote, dtype=np.uint8).view(bool),
+        }
+
+
+@dataclass(slots=True)
 class TalentProfile:
     """Represents a talent profile from Upwork."""
 
@@ -102,18 +435,34 @@ class TalentProfile:
     english_level: Optional[str] = None
 
     def __post_init__(self):
-        if self.skills is None:
-            self.skills = []
-        if self.badges is None:
-            self.badges = []
-
-    def to_dict(self) -> Dict:
-        data = asdict(self)
-        data['scraped_at'] = datetime.now().isoformat()
-        return data
-
-
-@dataclass
+        self.skills = [_intern(skill) for skill in self.skills] if self.skills else []
+        self.badges = [_intern(badge) for badge in self.badges] if self.badges else []
+        self.location = _intern(self.location)
+        self.english_level = _intern(self.english_level)
+
+    def to_dict(self, scraped_at: Optional[str] = None) -> Dict:
+        return {
+            'name': self.name,
+            'url': self.url,
+            'title': self.title,
+            'hourly_rate': self.hourly_rate,
+            'hourly_rate_min': self.hourly_rate_min,
+            'hourly_rate_max': self.hourly_rate_max,
+            'skills': list(self.skills),
+            'badges': list(self.badges),
+            'rating': self.rating,
+            'jobs_completed': self.jobs_completed,
+            'success_score': self.success_score,
+            'hours_worked': self.hours_worked,
+            'portfolio_items': self.portfolio_items,
+            'bio': self.bio,
+            'location': self.location,
+            'english_level': self.english_level,
+            'scraped_at': scraped_at or datetime.now().isoformat(timespec="seconds"),
+        }
+
+
+@dataclass(slots=True)
 class Project:
     """Represents a project from Upwork Project Catalog."""
 
@@ -134,13 +483,30 @@ class Project:
     sold_count: Optional[int] = None
 
     def __post_init__(self):
-        if self.skills is None:
-            self.skills = []
-
-    def to_dict(self) -> Dict:
-        data = asdict(self)
-        data['scraped_at'] = datetime.now().isoformat()
-        return data
+        self.skills = [_intern(skill) for skill in self.skills] if self.skills else []
+        self.delivery_time = _intern(self.delivery_time)
+        self.category = _intern(self.category)
+        self.subcategory = _intern(self.subcategory)
+
+    def to_dict(self, scraped_at: Optional[str] = None) -> Dict:
+        return {
+            'title': self.title,
+            'url': self.url,
+            'description': self.description,
+            'price': self.price,
+            'price_min': self.price_min,
+            'price_max': self.price_max,
+            'delivery_time': self.delivery_time,
+            'category': self.category,
+            'subcategory': self.subcategory,
+            'skills': list(self.skills),
+            'freelancer_name': self.freelancer_name,
+            'freelancer_url': self.freelancer_url,
+            'rating': self.rating,
+            'reviews_count': self.reviews_count,
+            'sold_count': self.sold_count,
+            'scraped_at': scraped_at or datetime.now().isoformat(timespec="seconds"),
+        }
 
 
 # =============================================================================
@@ -156,9 +522,23 @@ class ScraperConfig:
     slow_mo: int = 0
     user_agent: Optional[str] = None
     max_retries: int = 3
-    retry_delay: int = 2000  # ms
-    rate_limit_delay: int = 1000  # ms between requests
+    retry_delay: int = 2000  # ms, base of the exponential retry backoff
+    retry_max_delay: int = 30000  # ms, cap of the retry backoff after a failed load
+    captcha_retry_max_delay: int = 60000  # ms, cap of the retry backoff after a CAPTCHA/block page
+    rate_limit_delay: int = 1000  # ms between requests when Upwork sends no rate-limit headers
     max_pages: int = 10
+    max_contexts: int = 4  # browser contexts kept open and shared between searches
+    max_concurrency: int = 8  # fetch workers shared by all searches (also bounded by max_contexts)
+    wait_until: str = "domcontentloaded"  # Playwright load state awaited by page.goto
+    # Requests of these types are aborted; the parsers only read the HTML
+    blocked_resource_types: Tuple[str, ...] = ("image", "font", "media", "stylesheet")
+    # ...and so are requests whose URL contains any of these (analytics and ad trackers)
+    blocked_url_parts: Tuple[str, ...] = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
+    cache_ttl: float = 300  # seconds a finished search is reused for identical calls; 0 disables
+    cache_size: int = 128  # searches kept in the result cache
+    parse_cache_ttl: float = 0  # seconds parsed pages are kept under output_dir/.cache; 0 disables
+    parse_workers: int = 0  # processes that parse pages; 0 parses in a thread
+    extract_in_browser: bool = False  # read job cards with page.evaluate instead of returning the HTML
     save_to_file: bool = False
     output_dir: str = "./outputs"
 
@@ -171,6 +551,188 @@ class ScraperConfig:
             )
 
 
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+class AdaptiveLimiter:
+    """
+    Paces page loads from the server's rate-limit headers.
+
+    With X-RateLimit-Remaining/X-RateLimit-Reset available, the remaining
+    budget is spread evenly over the reset window; otherwise the configured
+    base delay is used. A 429 doubles the spacing (up to 2 ** max_backoff),
+    each successful document load halves it again, and Retry-After or an
+    exhausted budget pauses all requests until the server says to resume.
+    """
+
+    def __init__(self, base_delay: float, max_backoff: int):
+        self.base_delay = base_delay  # seconds
+        self.max_backoff = max_backoff
+        self._backoff = 0
+        self._interval = base_delay
+        self._next_at = 0.0
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def delay(self) -> float:
+        """Current spacing between requests, in seconds."""
+        return self._interval * (2 ** self._backoff)
+
+    async def acquire(self):
+        """Wait for the next request slot."""
+        async with self._lock:
+            wait = max(self._next_at, self._paused_until) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_at = time.monotonic() + self.delay
+
+    def update(self, response):
+        """Fold one Playwright response's status and headers into the pacing."""
+        headers = response.headers
+        if response.status == 429:
+            self._backoff = min(self._backoff + 1, self.max_backoff)
+        elif response.ok and response.request.resource_type == "document":
+            self._backoff = max(self._backoff - 1, 0)
+
+        now = time.monotonic()
+        retry_after = self._seconds_until(headers.get("retry-after"))
+        if retry_after is not None:
+            self._paused_until = max(self._paused_until, now + retry_after)
+
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = self._seconds_until(headers.get("x-ratelimit-reset"))
+        if remaining is None or not remaining.isdigit() or reset is None:
+            return
+        if int(remaining) == 0:
+            self._paused_until = max(self._paused_until, now + reset)
+        else:
+            self._interval = reset / int(remaining)
+
+    @staticmethod
+    def _seconds_until(value: Optional[str]) -> Optional[float]:
+        """Read a delta-seconds, epoch-seconds or HTTP-date header as seconds from now."""
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                return None
+        if seconds > 1e9:  # epoch timestamp rather than a delta
+            seconds -= time.time()
+        return max(seconds, 0.0)
+
+
+# =============================================================================
+# STREAMING EXPORT
+# =============================================================================
+
+class JsonlWriter:
+    """
+    Appends records to a JSON Lines file from a single background task.
+
+    put() serializes a record straight away, so the caller can drop the
+    object while the writer drains the queue to disk. The queue is bounded,
+    which makes fast producers wait instead of piling up lines in memory.
+    """
+
+    def __init__(self, filepath: str, max_pending: int = 1024):
+        self.filepath = filepath
+        self.count = 0
+        self._queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(max_pending)
+        self._file = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def open(self):
+        self._file = open(self.filepath, 'ab', buffering=1024 * 1024)
+        self._task = asyncio.create_task(self._drain())
+
+    async def put(self, item: Any):
+        """Queue one dataclass record (anything with to_dict()) for writing."""
+        if self._task.done():
+            self._task.result()  # surface a failed writer instead of blocking forever
+        record = item.to_dict()
+        if orjson is not None:
+            line = orjson.dumps(record) + b"\n"
+        else:
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+        await self._queue.put(line)
+        self.count += 1
+
+    async def close(self):
+        try:
+            if not self._task.done():
+                await self._queue.put(None)
+            await self._task
+        finally:
+            self._file.close()
+
+    async def _drain(self):
+        while True:
+            line = await self._queue.get()
+            if line is None:
+                return
+            self._file.write(line)
+
+
+# =============================================================================
+# PARSE CACHE
+# =============================================================================
+
+class ParseCache:
+    """
+    Parsed result pages on disk, keyed by a hash of the page HTML.
+
+    A page that comes back byte-for-byte identical (re-running a script
+    during development, say) is loaded from its cached records instead of
+    being parsed again. The key includes _PARSER_VERSION, so entries written
+    by older parsing code are never returned.
+    """
+
+    def __init__(self, directory: str, ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, kind: str, content: str) -> str:
+        digest = hashlib.blake2b(f"{_PARSER_VERSION}:{kind}:".encode(), digest_size=20)
+        digest.update(content.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def get(self, key: str, record_type: type) -> Optional[List[Any]]:
+        """Return the cached records for key, or None if missing or older than ttl."""
+        path = os.path.join(self.directory, f"{key}.json")
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl:
+                return None
+            with open(path, 'rb') as f:
+                raw = f.read()
+            records = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            return [record_type(**record) for record in records]
+        except (OSError, ValueError, TypeError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.debug(f"Ignoring unreadable parse cache entry {path}: {e}")
+            return None
+
+    def put(self, key: str, items: List[Any]):
+        path = os.path.join(self.directory, f"{key}.json")
+        records = [_record_fields(item) for item in items]
+        raw = orjson.dumps(records) if orjson is not None else json.dumps(records).encode('utf-8')
+
+        # Write to a temporary name first so a concurrent reader never sees half a file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write parse cache entry {path}: {e}")
+
+
 # =============================================================================
 # MAIN SCRAPER CLASS
 # =============================================================================
@@ -202,9 +764,24 @@ class UpworkScraper:
         self.config = config or ScraperConfig()
         self.playwright = None
         self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
-        self._last_request_time = 0
+        self._contexts: List[BrowserContext] = []
+        self._page_pool: Optional["asyncio.Queue[Page]"] = None
+        self._fetch_queue: Optional["asyncio.Queue[Tuple[str, Optional[str], asyncio.Future]]"] = None
+        self._fetch_workers: List[asyncio.Task] = []
+        self._limiter = AdaptiveLimiter(
+            self.config.rate_limit_delay / 1000, self.config.max_retries
+        )
+        self._blocked_types = frozenset(self.config.blocked_resource_types)
+        self._blocked_url_parts = tuple(self.config.blocked_url_parts)
+        self._search_cache: "OrderedDict[tuple, Tuple[float, List[Any]]]" = OrderedDict()
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_cache: Optional[ParseCache] = None
+        if self.config.parse_cache_ttl > 0:
+            self._parse_cache = ParseCache(
+                os.path.join(self.config.output_dir, ".cache"), self.config.parse_cache_ttl
+            )
+        if etree is None:
+            logger.warning("lxml is not installed; parsing pages with the much slower html.parser")
 
         logger.info("UpworkScraper initialized")
 
@@ -218,7 +795,7 @@ class UpworkScraper:
         await self.close()
 
     async def start(self):
-        """Start the browser and create a new context."""
+        """Start the browser and fill the page pool."""
         logger.info("Starting browser...")
         self.playwright = await async_playwright().start()
 
@@ -232,94 +809,227 @@ class UpworkScraper:
             ]
         )
 
-        self.context = await self.browser.new_context(
+        # One browser per scraper and one warm page per context; fetches borrow a page
+        # and navigate it, instead of opening and closing a page for every load.
+        self._page_pool = asyncio.Queue()
+        for _ in range(max(1, self.config.max_contexts)):
+            context = await self._new_context()
+            self._contexts.append(context)
+            self._page_pool.put_nowait(await self._new_page(context))
+
+        if self.config.parse_workers > 0:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.config.parse_workers)
+
+        # Page loads from every search share one queue, served in submission order
+        self._fetch_queue = asyncio.Queue()
+        self._fetch_workers = [
+            asyncio.create_task(self._fetch_worker())
+            for _ in range(max(1, self.config.max_concurrency))
+        ]
+
+        logger.info("Browser started successfully")
+
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context with the scraper's fingerprint settings."""
+        context = await self.browser.new_context(
             user_agent=self.config.user_agent,
             viewport={'width': 1920, 'height': 1080},
             locale='en-US'
         )
 
         # Add stealth scripts
-        await self.context.add_init_script("""
+        await context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
             });
         """)
 
-        self.page = await self.context.new_page()
-        self.page.set_default_timeout(self.config.timeout)
-
-        logger.info("Browser started successfully")
+        if self._blocked_types or self._blocked_url_parts:
+            await context.route("**/*", self._block_heavy)
+        return context
+
+    async def _new_page(self, context: BrowserContext) -> Page:
+        """Open a page in context, wired up for the pool."""
+        page = await context.new_page()
+        page.set_default_timeout(self.config.timeout)
+        page.on("response", self._observe_response)
+        return page
+
+    async def _block_heavy(self, route):
+        """Abort images, fonts, trackers and other assets before they are downloaded."""
+        request = route.request
+        if request.resource_type in self._blocked_types or any(
+            part in request.url for part in self._blocked_url_parts
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @asynccontextmanager
+    async def _acquire_page(self) -> AsyncIterator[Page]:
+        """Borrow a page from the pool; it is returned on exit."""
+        page = await self._page_pool.get()
+        try:
+            if page.is_closed():
+                # Crashed or closed from the page side; replace it within the same context
+                page = await self._new_page(page.context)
+            yield page
+        finally:
+            self._page_pool.put_nowait(page)
 
     async def close(self):
         """Close the browser and cleanup."""
         logger.info("Closing browser...")
 
-        if self.page:
-            await self.page.close()
-        if self.context:
-            await self.context.close()
+        for worker in self._fetch_workers:
+            worker.cancel()
+        await asyncio.gather(*self._fetch_workers, return_exceptions=True)
+        if self._fetch_queue is not None:
+            while not self._fetch_queue.empty():
+                self._fetch_queue.get_nowait()[2].cancel()
+
+        for context in self._contexts:
+            await context.close()
         if self.browser:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
-
-        self.page = None
-        self.context = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+
+        self._contexts = []
+        self._fetch_workers = []
+        self._fetch_queue = None
+        self._parse_pool = None
+        self._page_pool = None
         self.browser = None
         self.playwright = None
 
         logger.info("Browser closed")
 
-    async def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        now = asyncio.get_event_loop().time()
-        elapsed = (now - self._last_request_time) * 1000
+    async def _fetch_worker(self):
+        """Load queued URLs one after another, resolving each request's future with the page HTML."""
+        while True:
+            url, script, result = await self._fetch_queue.get()
+            if result.done():
+                continue  # the search that asked for it has already stopped
+
+            fetch = asyncio.ensure_future(self._fetch_content(url, script))
+            # A search closed early abandons its request; stop loading it straight away.
+            result.add_done_callback(lambda _, fetch=fetch: fetch.cancel())
+            try:
+                await asyncio.wait((fetch,))
+            except asyncio.CancelledError:
+                # The scraper is closing; don't leave the search waiting
+                fetch.cancel()
+                result.cancel()
+                raise
+
+            if result.done():
+                continue
+            if fetch.exception() is not None:
+                result.set_exception(fetch.exception())
+            else:
+                result.set_result(fetch.result())
+
+    async def _fetch_content(self, url: str, script: Optional[str] = None) -> Any:
+        """Load url in a pooled page and return its content (see _navigate_with_retry)."""
+        async with self._acquire_page() as page:
+            return await self._navigate_with_retry(page, url, script)
+
+    def _fetch_html(self, url: str, script: Optional[str] = None) -> "asyncio.Future[Any]":
+        """
+        Queue url for the fetch workers.
 
-        if elapsed < self.config.rate_limit_delay:
-            delay = (self.config.rate_limit_delay - elapsed) / 1000
-            await asyncio.sleep(delay)
+        The page is released as soon as its HTML (or the result of script)
+        is read, so parsing (by the caller) overlaps with the workers
+        loading the next queued URL.
+        """
+        result = asyncio.get_running_loop().create_future()
+        self._fetch_queue.put_nowait((url, script, result))
+        return result
 
-        self._last_request_time = asyncio.get_event_loop().time()
+    def _observe_response(self, response):
+        """Feed Upwork's own responses (not third-party assets) to the limiter."""
+        host = urlparse(response.url).hostname or ""
+        if host == "upwork.com" or host.endswith(".upwork.com"):
+            self._limiter.update(response)
 
-    async def _navigate_with_retry(self, url: str) -> bool:
+    async def _navigate_with_retry(self, page: Page, url: str, script: Optional[str] = None) -> Any:
         """
         Navigate to URL with retry logic.
 
         Args:
+            page: Page to navigate
             url: Target URL
+            script: Optional function evaluated in the page instead of
+                reading its HTML; it must return a dict with a "blocked" flag
 
         Returns:
-            True if successful, False otherwise
+            The page HTML (or the script's result) if successful, already
+            read for the CAPTCHA check so callers need not fetch it again;
+            None otherwise
         """
         for attempt in range(self.config.max_retries):
             try:
-                await self._rate_limit()
+                await self._limiter.acquire()
                 logger.info(f"Navigating to {url} (attempt {attempt + 1})")
 
-                await self.page.goto(url, wait_until="networkidle", timeout=self.config.timeout)
+                response = await page.goto(url, wait_until=self.config.wait_until, timeout=self.config.timeout)
+                if response is not None and response.status == 429:
+                    # The limiter has already widened its spacing; just try again.
+                    logger.warning(f"Rate limited (429), next request in {self._limiter.delay:.1f}s")
+                    continue
                 await asyncio.sleep(1)  # Wait for dynamic content
 
                 # Check for CAPTCHA or blocks
-                content = await self.page.content()
-                if "captcha" in content.lower() or "access denied" in content.lower():
+                if script is None:
+                    content = await page.content()
+                    blocked = _is_blocked_page(content)
+                else:
+                    content = await page.evaluate(script)
+                    blocked = content["blocked"]
+                if blocked:
                     logger.warning("CAPTCHA or access denied detected")
                     if attempt < self.config.max_retries - 1:
-                        await asyncio.sleep(self.config.retry_delay / 1000)
+                        await self._backoff(attempt, self.config.captcha_retry_max_delay)
                         continue
-                    return False
+                    return None
 
-                return True
+                return content
 
             except Exception as e:
                 logger.error(f"Navigation failed: {e}")
                 if attempt < self.config.max_retries - 1:
-                    await asyncio.sleep(self.config.retry_delay / 1000)
+                    await self._backoff(attempt, self.config.retry_max_delay)
                 else:
-                    return False
+                    return None
+
+        return None
 
-        return False
+    async def _backoff(self, attempt: int, max_delay: int):
+        """Sleep before retry number attempt + 1: exponential from retry_delay, capped, full jitter."""
+        delay = random.uniform(0, min(max_delay, self.config.retry_delay * 2 ** attempt)) / 1000
+        logger.info(f"Retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    @classmethod
+    def _absolute_url(cls, href: str) -> str:
+        """
+        urljoin(BASE_URL, href), without parsing the URL for plain site paths.
+
+        Card links are almost always "/path?query"; prefixing those gives the
+        same string urljoin would. Anything it might rewrite (dot segments,
+        empty query/fragment/params, control characters, other hosts) still
+        goes through urljoin.
+        """
+        if (href[:1] == "/" and href[1:2] != "/" and href[-1] not in "?#;" and href.isprintable()
+                and "/." not in href and "?#" not in href and ";?" not in href and ";#" not in href):
+            return cls.BASE_URL + href
+        return urljoin(cls.BASE_URL, href)
 
-    def _parse_budget(self, budget_str: str) -> tuple:
+    @classmethod
+    def _parse_budget(cls, budget_str: str) -> tuple:
         """Parse budget string to min/max values."""
         budget_min = None
         budget_max = None
@@ -328,7 +1038,7 @@ class UpworkScraper:
             return budget_min, budget_max
 
         # Extract numbers
-        numbers = re.findall(r'[\d,]+\.?\d*', budget_str.replace(',', ''))
+        numbers = _NUMBER_RE.findall(budget_str.replace(',', ''))
         if len(numbers) >= 2:
             budget_min = float(numbers[0])
             budget_max = float(numbers[1])
@@ -337,6 +1047,140 @@ class UpworkScraper:
 
         return budget_min, budget_max
 
+    async def _iter_search(
+        self,
+        search_url: str,
+        keyword: str,
+        max_pages: Optional[int],
+        filters: Optional[Dict],
+        kind: str,
+        record_type: type,
+        label: str,
+        unit: str,
+        browser_extract: Optional[Tuple[str, Callable[[Dict], List[Any]]]] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Fetch result pages concurrently and yield their items in page order.
+
+        Every page is queued for the shared fetch workers up front, so at
+        most config.max_concurrency pages load at a time across all searches,
+        and each page is parsed while later ones are still loading. As
+        before, iteration stops at the first page with no results; pages
+        after it (or all outstanding pages, if the caller stops early) are
+        cancelled.
+
+        browser_extract is an optional (script, build) pair: script reads the
+        cards inside the page and build turns its result into records, so the
+        page HTML never has to come back.
+        """
+        max_pages = max_pages or self.config.max_pages
+
+        logger.info(f"Searching for {label}: '{keyword}' (max {max_pages} pages)")
+
+        # Build URL with query parameters
+        params = {"q": keyword}
+        if filters:
+            params.update(filters)
+
+        url = f"{search_url}?{urlencode(params)}"
+        script, build = browser_extract or (None, None)
+
+        async def fetch(page_num: int) -> Optional[List[Any]]:
+            try:
+                content = await self._fetch_html(f"{url}&page={page_num}", script)
+            except Exception as e:
+                # One broken page shouldn't throw away the pages fetched alongside it
+                logger.error(f"Failed to load page {page_num}: {e}")
+                return None
+            if content is None:
+                logger.warning(f"Failed to load page {page_num}")
+                return None
+            if script is not None:
+                return build(content)
+            return await self._parse_page(kind, content, record_type)
+
+        tasks = [asyncio.create_task(fetch(page_num)) for page_num in range(1, max_pages + 1)]
+        total = 0
+        try:
+            for page_num, task in enumerate(tasks, 1):
+                items = await task
+                if items is None:
+                    continue
+
+                logger.info(f"Page {page_num}: Found {len(items)} {unit}")
+
+                if not items:
+                    break  # No more results
+
+                total += len(items)
+                for item in items:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info(f"Total {label} found: {total}")
+
+    async def _cached_search(
+        self,
+        kind: str,
+        keyword: str,
+        max_pages: Optional[int],
+        filters: Optional[Dict],
+        refresh: bool,
+        iterate: Callable[..., AsyncIterator[Any]],
+    ) -> List[Any]:
+        """Collect a search, reusing a result younger than config.cache_ttl for the same arguments."""
+        max_pages = max_pages or self.config.max_pages
+        key = (kind, keyword, max_pages, tuple(sorted((filters or {}).items())))
+        use_cache = self.config.cache_ttl > 0
+
+        if use_cache and not refresh:
+            hit = self._search_cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < self.config.cache_ttl:
+                self._search_cache.move_to_end(key)
+                logger.info(f"Using cached {kind} results for '{keyword}' ({len(hit[1])} items)")
+                return _copy_records(hit[1])
+
+        results = [item async for item in iterate(keyword, max_pages, filters)]
+        # Empty results are more likely a failed load than a real answer; don't pin them.
+        if use_cache and results:
+            self._search_cache[key] = (time.monotonic(), results)
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self.config.cache_size:
+                self._search_cache.popitem(last=False)
+            return _copy_records(results)
+        return results
+
+    async def _parse_page(self, kind: str, content: str, record_type: type) -> List[Any]:
+        """
+        Parse a result page with _parse_<kind>_html.
+
+        Goes through the on-disk parse cache when it is enabled, and runs the
+        parser in the worker processes when config.parse_workers is set, or
+        in a thread otherwise, so the event loop keeps driving other page
+        loads meanwhile.
+        """
+        key = None
+        if self._parse_cache is not None:
+            key = self._parse_cache.key(kind, content)
+            items = self._parse_cache.get(key, record_type)
+            if items is not None:
+                logger.debug(f"Parse cache hit for {kind} page {key[:12]}")
+                return items
+
+        if self._parse_pool is not None:
+            loop = asyncio.get_running_loop()
+            records = await loop.run_in_executor(self._parse_pool, _parse_records, kind, content)
+            items = [record_type(**record) for record in records]
+        else:
+            items = await asyncio.to_thread(getattr(self, f"_parse_{kind}_html"), content)
+
+        if key is not None and items:  # an empty page is more likely a failed render than a real answer
+            self._parse_cache.put(key, items)
+        return items
+
     # =========================================================================
     # JOB SEARCH METHODS
     # =========================================================================
@@ -345,7 +1189,8 @@ class UpworkScraper:
         self,
         keyword: str,
         max_pages: Optional[int] = None,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        refresh: bool = False
     ) -> List[JobListing]:
         """
         Search for jobs on Upwork.
@@ -354,53 +1199,49 @@ class UpworkScraper:
             keyword: Search keyword (e.g., "python developer")
             max_pages: Maximum number of pages to scrape
             filters: Optional filters dict (e.g., {"job_type": "hourly"})
+            refresh: Ignore a cached result for the same search and fetch again
 
         Returns:
             List of JobListing objects
         """
-        max_pages = max_pages or self.config.max_pages
-        all_jobs = []
-
-        logger.info(f"Searching for jobs: '{keyword}' (max {max_pages} pages)")
-
-        # Build URL with query parameters
-        params = {"q": keyword}
-        if filters:
-            params.update(filters)
-
-        url = f"{self.JOBS_SEARCH_URL}?{urlencode(params)}"
-
-        for page_num in range(1, max_pages + 1):
-            page_url = f"{url}&page={page_num}"
-
-            if not await self._navigate_with_retry(page_url):
-                logger.warning(f"Failed to load page {page_num}")
-                continue
-
-            jobs = await self._extract_jobs_from_page()
-            all_jobs.extend(jobs)
-
-            logger.info(f"Page {page_num}: Found {len(jobs)} jobs")
+        return await self._cached_search(
+            "jobs", keyword, max_pages, filters, refresh, self.iter_jobs
+        )
 
-            if not jobs:
-                break  # No more results
+    def iter_jobs(
+        self,
+        keyword: str,
+        max_pages: Optional[int] = None,
+        filters: Optional[Dict] = None
+    ) -> AsyncIterator[JobListing]:
+        """
+        Like search_jobs, but yield jobs as each result page is parsed.
 
-        logger.info(f"Total jobs found: {len(all_jobs)}")
-        return all_jobs
+        Closing the iterator early cancels the pages still being fetched.
+        """
+        return self._iter_search(
+            self.JOBS_SEARCH_URL, keyword, max_pages, filters,
+            "jobs", JobListing, label="jobs", unit="jobs",
+            browser_extract=(
+                (_JOB_CARDS_JS, self._jobs_from_browser) if self.config.extract_in_browser else None
+            ),
+        )
 
-    async def _extract_jobs_from_page(self) -> List[JobListing]:
-        """Extract job listings from current page."""
-        content = await self.page.content()
-        soup = BeautifulSoup(content, 'html.parser')
+    @classmethod
+    def _parse_jobs_html(cls, content: str) -> List[JobListing]:
+        """Parse job listings out of a search results page."""
         jobs = []
 
         # Upwork uses dynamic rendering, try to find job cards
         # These selectors may need adjustment based on current HTML structure
-        job_cards = soup.select('[data-qa="job-tile"]') or soup.select('.job-tile') or soup.select('section[data-test="JobTile"]')
+        if etree is not None:
+            job_cards = _stream_job_cards(content)
+        else:
+            job_cards = _select_cards(content, _JOB_CARD_SCOPES)
 
         for card in job_cards:
             try:
-                job = self._parse_job_card(card)
+                job = cls._parse_job_card(card)
                 if job and job.title:  # Only add if has a title
                     jobs.append(job)
             except Exception as e:
@@ -409,121 +1250,116 @@ class UpworkScraper:
 
         # Also try to extract from embedded JSON data
         if not jobs:
-            jobs = await self._extract_jobs_from_json()
+            jobs = cls._extract_jobs_from_json(content)
 
         return jobs
 
-    def _parse_job_card(self, card) -> Optional[JobListing]:
+    @classmethod
+    def _parse_job_card(cls, card) -> Optional[JobListing]:
         """Parse a single job card HTML element."""
-        # Extract title
-        title_elem = card.select_one('[data-qa="job-title"]') or card.select_one('h3') or card.select_one('.job-title')
-        title = title_elem.get_text(strip=True) if title_elem else ""
-
+        title_elem = card.find(attrs={"data-qa": "job-title"}) or card.find('h3') or card.find(class_="job-title")
+        url_elem = card.find('a', href=_JOB_HREF) or card.find('a', attrs={"data-qa": "job-title-link"})
+        desc_elem = card.find(attrs={"data-qa": "job-description"}) or card.find(class_="job-description")
+        budget_elem = card.find(attrs={"data-qa": "job-type"}) or card.find(class_="budget")
+        skill_elems = card.find_all(attrs={"data-qa": "skill"}) or card.find_all(class_="skill-pill")
+        spent_elem = card.find(attrs={"data-qa": "client-spent"}) or card.find(class_="client-spent")
+        proposals_elem = card.find(attrs={"data-qa": "proposal-count"}) or card.find(class_="proposals")
+
+        # Same raw fields as _JOB_CARDS_JS reads in the browser
+        return cls._job_from_fields({
+            'title': title_elem.get_text(strip=True) if title_elem else "",
+            'href': url_elem.get('href') if url_elem else None,
+            'description': desc_elem.get_text(strip=True) if desc_elem else "",
+            'budget': budget_elem.get_text(strip=True) if budget_elem else None,
+            'skills': [elem.get_text(strip=True) for elem in skill_elems[:10]],  # Limit to first 10
+            'client_verified': card.find(attrs={"data-qa": "client-verified"}) is not None,
+            'client_payment_verified': card.find(attrs={"data-qa": "client-payment-verified"}) is not None,
+            'client_spent': spent_elem.get_text(strip=True) if spent_elem else None,
+            'proposals': proposals_elem.get_text() if proposals_elem else None,
+        })
+
+    @classmethod
+    def _job_from_fields(cls, fields: Dict) -> JobListing:
+        """Build a JobListing from the raw text of a job card's fields."""
         # Extract URL
-        url_elem = card.select_one('a[href*="/jobs/"]') or card.select_one('a[data-qa="job-title-link"]')
         url = ""
-        if url_elem and url_elem.get('href'):
-            url = urljoin(self.BASE_URL, url_elem['href'])
-
-        # Extract description
-        desc_elem = card.select_one('[data-qa="job-description"]') or card.select_one('.job-description')
-        description = desc_elem.get_text(strip=True) if desc_elem else ""
+        if fields['href']:
+            url = cls._absolute_url(fields['href'])
 
         # Extract budget
-        budget_elem = card.select_one('[data-qa="job-type"]') or card.select_one('.budget')
-        budget = budget_elem.get_text(strip=True) if budget_elem else None
-        budget_min, budget_max = self._parse_budget(budget) if budget else (None, None)
+        budget = fields['budget']
+        budget_min, budget_max = cls._parse_budget(budget) if budget else (None, None)
 
         # Parse job type from budget string
         job_type = None
         if budget:
-            if "hourly" in budget.lower():
+            budget_lower = budget.lower()
+            if "hourly" in budget_lower:
                 job_type = "hourly"
-            elif "fixed" in budget.lower() or "budget" in budget.lower():
+            elif "fixed" in budget_lower or "budget" in budget_lower:
                 job_type = "fixed"
 
-        # Extract skills
-        skills = []
-        skill_elems = card.select('[data-qa="skill"]') or card.select('.skill-pill')
-        for elem in skill_elems[:10]:  # Limit to first 10
-            skill = elem.get_text(strip=True)
-            if skill:
-                skills.append(skill)
-
-        # Extract client info
-        verified = False
-        payment_verified = False
-        spent = None
-        hires = None
-
-        verified_elem = card.select_one('[data-qa="client-verified"]')
-        if verified_elem:
-            verified = True
-
-        payment_elem = card.select_one('[data-qa="client-payment-verified"]')
-        if payment_elem:
-            payment_verified = True
-
-        spent_elem = card.select_one('[data-qa="client-spent"]') or card.select_one('.client-spent')
-        if spent_elem:
-            spent = spent_elem.get_text(strip=True)
-
         # Extract proposals count
         proposals = None
-        proposals_elem = card.select_one('[data-qa="proposal-count"]') or card.select_one('.proposals')
-        if proposals_elem:
-            proposals_match = re.search(r'(\d+)', proposals_elem.get_text())
+        if fields['proposals']:
+            proposals_match = _INT_RE.search(fields['proposals'])
             if proposals_match:
-                proposals = int(proposals_match.group(1))
+                proposals = int(proposals_match.group())
 
         return JobListing(
-            title=title,
+            title=fields['title'],
             url=url,
-            description=description,
+            description=fields['description'],
             budget=budget,
             budget_min=budget_min,
             budget_max=budget_max,
             job_type=job_type,
-            skills=skills,
-            client_verified=verified,
-            client_payment_verified=payment_verified,
-            client_spent=spent,
-            client_hires=hires,
+            skills=list(dict.fromkeys(skill for skill in fields['skills'] if skill)),  # Tiles often repeat a pill
+            client_verified=fields['client_verified'],
+            client_payment_verified=fields['client_payment_verified'],
+            client_spent=fields['client_spent'],
+            client_hires=None,
             proposals_count=proposals
         )
 
-    async def _extract_jobs_from_json(self) -> List[JobListing]:
+    @classmethod
+    def _extract_jobs_from_json(cls, content: str) -> List[JobListing]:
         """Extract jobs from embedded JSON data in the page."""
+        # Try to find JSON-LD or similar structured data
+        return cls._jobs_from_json_texts(
+            match for pattern in _EMBEDDED_JSON_RES for match in pattern.findall(content)
+        )
+
+    @classmethod
+    def _jobs_from_json_texts(cls, texts: Iterable[str]) -> List[JobListing]:
+        """Parse jobs out of embedded JSON documents, skipping any that don't decode."""
         jobs = []
 
         try:
-            # Look for embedded JSON data
-            content = await self.page.content()
-
-            # Try to find JSON-LD or similar structured data
-            json_patterns = [
-                r'<script\s+type="application/ld\+json">(.*?)</script>',
-                r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
-                r'__UPWORK__\s*=\s*({.*?});'
-            ]
-
-            for pattern in json_patterns:
-                matches = re.findall(pattern, content, re.DOTALL)
-                for match in matches:
-                    try:
-                        data = json.loads(match)
-                        # Process the JSON data structure
-                        # This will vary based on Upwork's current implementation
-                        jobs.extend(self._parse_jobs_from_json(data))
-                    except json.JSONDecodeError:
-                        continue
+            for text in texts:
+                try:
+                    data = json.loads(text)
+                    # Process the JSON data structure
+                    # This will vary based on Upwork's current implementation
+                    jobs.extend(cls._parse_jobs_from_json(data))
+                except json.JSONDecodeError:
+                    continue
 
         except Exception as e:
             logger.debug(f"Failed to extract from JSON: {e}")
 
         return jobs
 
-    def _parse_jobs_from_json(self, data: Dict) -> List[JobListing]:
+    @classmethod
+    def _jobs_from_browser(cls, payload: Dict) -> List[JobListing]:
+        """Build jobs from the result of _JOB_CARDS_JS."""
+        jobs = [job for job in map(cls._job_from_fields, payload["cards"]) if job.title]
+        if not jobs:
+            jobs = cls._jobs_from_json_texts(payload["embedded"])
+        return jobs
+
+    @classmethod
+    def _parse_jobs_from_json(cls, data: Dict) -> List[JobListing]:
         """Parse jobs from JSON data structure."""
         jobs = []
 
@@ -553,7 +1389,8 @@ class UpworkScraper:
         self,
         keyword: str,
         max_pages: Optional[int] = None,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        refresh: bool = False
     ) -> List[TalentProfile]:
         """
         Search for talent/freelancers on Upwork.
@@ -562,51 +1399,42 @@ class UpworkScraper:
             keyword: Search keyword (e.g., "python developer")
             max_pages: Maximum number of pages to scrape
             filters: Optional filters dict
+            refresh: Ignore a cached result for the same search and fetch again
 
         Returns:
             List of TalentProfile objects
         """
-        max_pages = max_pages or self.config.max_pages
-        all_talent = []
-
-        logger.info(f"Searching for talent: '{keyword}' (max {max_pages} pages)")
-
-        params = {"q": keyword}
-        if filters:
-            params.update(filters)
-
-        url = f"{self.TALENT_SEARCH_URL}?{urlencode(params)}"
-
-        for page_num in range(1, max_pages + 1):
-            page_url = f"{url}&page={page_num}"
-
-            if not await self._navigate_with_retry(page_url):
-                logger.warning(f"Failed to load page {page_num}")
-                continue
-
-            talent = await self._extract_talent_from_page()
-            all_talent.extend(talent)
-
-            logger.info(f"Page {page_num}: Found {len(talent)} profiles")
+        return await self._cached_search(
+            "talent", keyword, max_pages, filters, refresh, self.iter_talent
+        )
 
-            if not talent:
-                break
+    def iter_talent(
+        self,
+        keyword: str,
+        max_pages: Optional[int] = None,
+        filters: Optional[Dict] = None
+    ) -> AsyncIterator[TalentProfile]:
+        """
+        Like search_talent, but yield talent profiles as each result page is parsed.
 
-        logger.info(f"Total talent found: {len(all_talent)}")
-        return all_talent
+        Closing the iterator early cancels the pages still being fetched.
+        """
+        return self._iter_search(
+            self.TALENT_SEARCH_URL, keyword, max_pages, filters,
+            "talent", TalentProfile, label="talent", unit="profiles",
+        )
 
-    async def _extract_talent_from_page(self) -> List[TalentProfile]:
-        """Extract talent profiles from current page."""
-        content = await self.page.content()
-        soup = BeautifulSoup(content, 'html.parser')
+    @classmethod
+    def _parse_talent_html(cls, content: str) -> List[TalentProfile]:
+        """Parse talent profiles out of a search results page."""
         talent_list = []
 
         # Find talent profile cards
-        cards = soup.select('[data-qa="talent-tile"]') or soup.select('.talent-tile') or soup.select('article[data-test="FreelancerTile"]')
+        cards = _select_cards(content, _TALENT_CARD_SCOPES)
 
         for card in cards:
             try:
-                talent = self._parse_talent_card(card)
+                talent = cls._parse_talent_card(card)
                 if talent and talent.name:
                     talent_list.append(talent)
             except Exception as e:
@@ -615,66 +1443,59 @@ class UpworkScraper:
 
         return talent_list
 
-    def _parse_talent_card(self, card) -> Optional[TalentProfile]:
+    @classmethod
+    def _parse_talent_card(cls, card) -> Optional[TalentProfile]:
         """Parse a single talent card HTML element."""
         # Extract name
-        name_elem = card.select_one('[data-qa="talent-name"]') or card.select_one('.talent-name') or card.select_one('h4')
+        name_elem = card.find(attrs={"data-qa": "talent-name"}) or card.find(class_="talent-name") or card.find('h4')
         name = name_elem.get_text(strip=True) if name_elem else ""
 
         # Extract URL
-        url_elem = card.select_one('a[href*="/profile/"]')
+        url_elem = card.find('a', href=_PROFILE_HREF)
         url = ""
         if url_elem and url_elem.get('href'):
-            url = urljoin(self.BASE_URL, url_elem['href'])
+            url = cls._absolute_url(url_elem['href'])
 
         # Extract title
-        title_elem = card.select_one('[data-qa="talent-title"]') or card.select_one('.talent-title') or card.select_one('.profile-title')
+        title_elem = card.find(attrs={"data-qa": "talent-title"}) or card.find(class_="talent-title") or card.find(class_="profile-title")
         title = title_elem.get_text(strip=True) if title_elem else ""
 
         # Extract hourly rate
-        rate_elem = card.select_one('[data-qa="hourly-rate"]') or card.select_one('.hourly-rate')
+        rate_elem = card.find(attrs={"data-qa": "hourly-rate"}) or card.find(class_="hourly-rate")
         hourly_rate = rate_elem.get_text(strip=True) if rate_elem else None
 
         rate_min, rate_max = None, None
         if hourly_rate:
-            numbers = re.findall(r'[\d,]+\.?\d*', hourly_rate.replace(',', ''))
+            numbers = _NUMBER_RE.findall(hourly_rate.replace(',', ''))
             if len(numbers) >= 2:
                 rate_min = float(numbers[0])
                 rate_max = float(numbers[1])
             elif len(numbers) == 1:
                 rate_min = float(numbers[0])
 
-        # Extract skills
-        skills = []
-        skill_elems = card.select('[data-qa="skill"]') or card.select('.skill-pill') or card.select('.air3-badge')
-        for elem in skill_elems[:10]:
-            skill = elem.get_text(strip=True)
-            if skill:
-                skills.append(skill)
+        # Extract skills, dropping repeats but keeping first-seen order
+        skill_elems = card.find_all(attrs={"data-qa": "skill"}) or card.find_all(class_="skill-pill") or card.find_all(class_="air3-badge")
+        skills = list(dict.fromkeys(skill for skill in (elem.get_text(strip=True) for elem in skill_elems[:10]) if skill))
 
         # Extract badges
-        badges = []
-        badge_elems = card.select('[data-qa="badge"]') or card.select('.badge')
-        for elem in badge_elems:
-            badge = elem.get_text(strip=True)
-            if badge:
-                badges.append(badge)
+        badge_elems = card.find_all(attrs={"data-qa": "badge"}) or card.find_all(class_="badge")
+        badges = list(dict.fromkeys(badge for badge in (elem.get_text(strip=True) for elem in badge_elems) if badge))
 
         # Extract rating
         rating = None
-        rating_elem = card.select_one('[data-qa="rating"]') or card.select_one('.rating')
+        rating_elem = card.find(attrs={"data-qa": "rating"}) or card.find(class_="rating")
         if rating_elem:
-            rating_match = re.search(r'(\d+\.?\d*)', rating_elem.get_text())
+            rating_match = _DECIMAL_RE.search(rating_elem.get_text())
             if rating_match:
-                rating = float(rating_match.group(1))
+                rating = float(rating_match.group())
 
         # Extract jobs completed
         jobs_completed = None
-        jobs_elem = card.select_one('[data-qa="jobs-completed"]') or card.select_one('.jobs-completed')
+        jobs_elem = card.find(attrs={"data-qa": "jobs-completed"}) or card.find(class_="jobs-completed")
         if jobs_elem:
-            jobs_match = re.search(r'(\d+)', jobs_elem.get_text())
+            jobs_match = _INT_RE.search(jobs_elem.get_text())
             if jobs_match:
-                jobs_completed = int(jobs_match.group(1))
+                jobs_completed = int(jobs_match.group())
 
         return TalentProfile(
             name=name,
@@ -697,7 +1518,8 @@ class UpworkScraper:
         self,
         keyword: str,
         max_pages: Optional[int] = None,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        refresh: bool = False
     ) -> List[Project]:
         """
         Search for projects in Upwork Project Catalog.
@@ -706,51 +1528,42 @@ class UpworkScraper:
             keyword: Search keyword (e.g., "web development")
             max_pages: Maximum number of pages to scrape
             filters: Optional filters dict
+            refresh: Ignore a cached result for the same search and fetch again
 
         Returns:
             List of Project objects
         """
-        max_pages = max_pages or self.config.max_pages
-        all_projects = []
-
-        logger.info(f"Searching for projects: '{keyword}' (max {max_pages} pages)")
-
-        params = {"q": keyword}
-        if filters:
-            params.update(filters)
-
-        url = f"{self.PROJECTS_URL}?{urlencode(params)}"
-
-        for page_num in range(1, max_pages + 1):
-            page_url = f"{url}&page={page_num}"
-
-            if not await self._navigate_with_retry(page_url):
-                logger.warning(f"Failed to load page {page_num}")
-                continue
-
-            projects = await self._extract_projects_from_page()
-            all_projects.extend(projects)
-
-            logger.info(f"Page {page_num}: Found {len(projects)} projects")
+        return await self._cached_search(
+            "projects", keyword, max_pages, filters, refresh, self.iter_projects
+        )
 
-            if not projects:
-                break
+    def iter_projects(
+        self,
+        keyword: str,
+        max_pages: Optional[int] = None,
+        filters: Optional[Dict] = None
+    ) -> AsyncIterator[Project]:
+        """
+        Like search_projects, but yield projects as each result page is parsed.
 
-        logger.info(f"Total projects found: {len(all_projects)}")
-        return all_projects
+        Closing the iterator early cancels the pages still being fetched.
+        """
+        return self._iter_search(
+            self.PROJECTS_URL, keyword, max_pages, filters,
+            "projects", Project, label="projects", unit="projects",
+        )
 
-    async def _extract_projects_from_page(self) -> List[Project]:
-        """Extract projects from current page."""
-        content = await self.page.content()
-        soup = BeautifulSoup(content, 'html.parser')
+    @classmethod
+    def _parse_projects_html(cls, content: str) -> List[Project]:
+        """Parse projects out of a catalog results page."""
         projects = []
 
         # Find project cards
-        cards = soup.select('[data-qa="project-tile"]') or soup.select('.project-tile') or soup.select('article[class*="project"]')
+        cards = _select_cards(content, _PROJECT_CARD_SCOPES)
 
         for card in cards:
             try:
-                project = self._parse_project_card(card)
+                project = cls._parse_project_card(card)
                 if project and project.title:
                     projects.append(project)
             except Exception as e:
@@ -759,55 +1572,52 @@ class UpworkScraper:
 
         return projects
 
-    def _parse_project_card(self, card) -> Optional[Project]:
+    @classmethod
+    def _parse_project_card(cls, card) -> Optional[Project]:
         """Parse a single project card HTML element."""
         # Extract title
-        title_elem = card.select_one('[data-qa="project-title"]') or card.select_one('h3') or card.select_one('.project-title')
+        title_elem = card.find(attrs={"data-qa": "project-title"}) or card.find('h3') or card.find(class_="project-title")
         title = title_elem.get_text(strip=True) if title_elem else ""
 
         # Extract URL
-        url_elem = card.select_one('a[href*="/projects/"]')
+        url_elem = card.find('a', href=_PROJECT_HREF)
         url = ""
         if url_elem and url_elem.get('href'):
-            url = urljoin(self.BASE_URL, url_elem['href'])
+            url = cls._absolute_url(url_elem['href'])
 
         # Extract description
-        desc_elem = card.select_one('[data-qa="project-description"]') or card.select_one('.project-description')
+        desc_elem = card.find(attrs={"data-qa": "project-description"}) or card.find(class_="project-description")
         description = desc_elem.get_text(strip=True) if desc_elem else ""
 
         # Extract price
-        price_elem = card.select_one('[data-qa="project-price"]') or card.select_one('.price') or card.select_one('.project-price')
+        price_elem = card.find(attrs={"data-qa": "project-price"}) or card.find(class_="price") or card.find(class_="project-price")
         price = price_elem.get_text(strip=True) if price_elem else None
 
         price_min, price_max = None, None
         if price:
-            numbers = re.findall(r'[\d,]+\.?\d*', price.replace(',', ''))
+            numbers = _NUMBER_RE.findall(price.replace(',', ''))
             if len(numbers) >= 1:
                 price_min = float(numbers[0])
             if len(numbers) >= 2:
                 price_max = float(numbers[1])
 
         # Extract delivery time
-        delivery_elem = card.select_one('[data-qa="delivery-time"]') or card.select_one('.delivery-time')
+        delivery_elem = card.find(attrs={"data-qa": "delivery-time"}) or card.find(class_="delivery-time")
         delivery_time = delivery_elem.get_text(strip=True) if delivery_elem else None
 
-        # Extract skills
-        skills = []
-        skill_elems = card.select('[data-qa="skill"]') or card.select('.skill-tag')
-        for elem in skill_elems[:10]:
-            skill = elem.get_text(strip=True)
-            if skill:
-                skills.append(skill)
+        # Extract skills, dropping repeats but keeping first-seen order
+        skill_elems = card.find_all(attrs={"data-qa": "skill"}) or card.find_all(class_="skill-tag")
+        skills = list(dict.fromkeys(skill for skill in (elem.get_text(strip=True) for elem in skill_elems[:10]) if skill))
 
         # Extract freelancer info
         freelancer_name = None
         freelancer_url = None
-        name_elem = card.select_one('[data-qa="freelancer-name"]') or card.select_one('.freelancer-name')
+        name_elem = card.find(attrs={"data-qa": "freelancer-name"}) or card.find(class_="freelancer-name")
         if name_elem:
             freelancer_name = name_elem.get_text(strip=True)
-            link = name_elem.select_one('a')
+            link = name_elem.find('a')
             if link and link.get('href'):
-                freelancer_url = urljoin(self.BASE_URL, link['href'])
+                freelancer_url = cls._absolute_url(link['href'])
 
         return Project(
             title=title,
@@ -852,16 +1662,60 @@ class UpworkScraper:
             data: List of dataclass objects
             filename: Output filename
         """
-        import os
-
         os.makedirs(self.config.output_dir, exist_ok=True)
         filepath = os.path.join(self.config.output_dir, filename)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump([item.to_dict() for item in data], f, indent=2, ensure_ascii=False)
+        # One timestamp for the whole batch instead of a clock read per record
+        scraped_at = datetime.now().isoformat(timespec="seconds")
+        records = [item.to_dict(scraped_at) for item in data]
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly, same layout as indent=2 below
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+        else:
+            # json.dump() would write() once per encoder chunk; encode first
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(records, indent=2, ensure_ascii=False))
 
         logger.info(f"Saved {len(data)} records to {filepath}")
 
+    @asynccontextmanager
+    async def save_to_jsonl(self, filename: str) -> AsyncIterator[JsonlWriter]:
+        """
+        Stream records to a JSON Lines file as they are scraped.
+
+        Args:
+            filename: Output filename (appended to if it exists)
+
+        Example:
+            >>> async with scraper.save_to_jsonl("jobs.jsonl") as out:
+            ...     async for job in scraper.iter_jobs("python developer"):
+            ...         await out.put(job)
+        """
+        os.makedirs(self.config.output_dir, exist_ok=True)
+        filepath = os.path.join(self.config.output_dir, filename)
+
+        writer = JsonlWriter(filepath)
+        await writer.open()
+        try:
+            yield writer
+        finally:
+            await writer.close()
+
+        logger.info(f"Saved {writer.count} records to {filepath}")
+
+
+def _parse_records(kind: str, content: str) -> List[Dict]:
+    """
+    Parse a result page into plain field dicts.
+
+    Entry point for the parse worker processes: a module-level function
+    pickles by name, and dicts cross the process boundary more cheaply than
+    the dataclasses, which the scraper rebuilds on its side.
+    """
+    parse = getattr(UpworkScraper, f"_parse_{kind}_html")
+    return [_record_fields(item) for item in parse(content)]
+
 
 # =============================================================================
 # MAIN EXECUTION
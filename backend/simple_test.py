@@ -1,13 +1,18 @@
 """
 Simple FastAPI test server
 """
+import hashlib
+from collections import deque
+from functools import lru_cache
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List
 import uvicorn
 
-app = FastAPI(title="Upwork DNA API")
+app = FastAPI(title="Upwork DNA API", default_response_class=ORJSONResponse)
 
 # CORS
 app.add_middleware(
@@ -25,7 +30,12 @@ class QueueItem(BaseModel):
     priority: int = 0
 
 # In-memory storage
-queue = []
+queue = deque()
+
+# Stable across processes and restarts, unlike hash() on a str
+@lru_cache(maxsize=1024)
+def _kw_id(keyword: str) -> str:
+    return hashlib.blake2b(keyword.encode(), digest_size=8).hexdigest()
 
 @app.get("/")
 async def root():
@@ -50,14 +60,14 @@ async def add_to_queue(item: QueueItem):
 
 @app.get("/queue")
 async def get_queue():
-    return {"items": queue, "count": len(queue)}
+    return {"items": list(queue), "count": len(queue)}
 
 @app.post("/scrape")
 async def start_scraping(request: dict):
     keyword = request.get("keyword", "")
     # Mock scraping response
     return {
-        "job_id": f"job_{keyword}_{hash(keyword)}",
+        "job_id": f"job_{keyword}_{_kw_id(keyword)}",
         "keyword": keyword,
         "status": "running",
         "message": f"Scraping started for '{keyword}'"
@@ -1,15 +1,35 @@
+import json
+import shutil
 import tempfile
+import threading
+import time
 import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
 
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base, JobRaw, PipelineEvent
 from orchestrator import (
     OrchestratorService,
     compute_fit_score,
     compute_safety_score,
+    find_fit_terms,
     parse_money_value,
 )
 
 
 class OrchestratorScoringTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The tests only use pure helpers, so one service serves the whole class.
+        data_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, data_root, ignore_errors=True)
+        cls.service = OrchestratorService(data_root=data_root)
+
     def test_parse_money_value_supports_ranges_and_k(self):
         self.assertAlmostEqual(parse_money_value("$500-$1,500"), 1000.0)
         self.assertAlmostEqual(parse_money_value("2k"), 2000.0)
@@ -19,6 +39,13 @@ class OrchestratorScoringTests(unittest.TestCase):
         score = compute_fit_score(text)
         self.assertGreaterEqual(score, 60.0)
 
+    def test_find_fit_terms_keeps_nested_terms(self):
+        text = "build an ai agent for web scraping with python"
+        self.assertEqual(
+            find_fit_terms(text),
+            ["python", "ai agent", "web scraping", "ai", "scraping"],
+        )
+
     def test_safety_score_flags_suspicious_jobs(self):
         safe = compute_safety_score(
             payment_verified=True,
@@ -39,7 +66,6 @@ class OrchestratorScoringTests(unittest.TestCase):
         self.assertLess(risky, 50.0)
 
     def test_column_mapping_variants(self):
-        service = OrchestratorService(data_root=tempfile.gettempdir())
         row = {
             "job_title": "Python Data Analyst",
             "detail_summary": "Need ETL and dashboard automation with SQL",
@@ -50,14 +76,13 @@ class OrchestratorScoringTests(unittest.TestCase):
             "proposals": "10 to 15",
             "keyword": "ai data analyst",
         }
-        normalized = service._normalize_job_row(row, "fallback keyword")
+        normalized = self.service._normalize_job_row(row, "fallback keyword")
         self.assertEqual(normalized["keyword"], "ai data analyst")
         self.assertTrue(normalized["payment_verified"])
         self.assertEqual(normalized["job_key"], "~0123456789")
         self.assertGreater(normalized["budget_value"], 40)
 
     def test_draft_builder_outputs_hooks(self):
-        service = OrchestratorService(data_root=tempfile.gettempdir())
         row = {
             "title": "AI Dashboard Build",
             "description": "Need Python + SQL ETL dashboard for analytics",
@@ -65,7 +90,7 @@ class OrchestratorScoringTests(unittest.TestCase):
             "budget": "$500",
             "keyword": "ai data analyst",
         }
-        job = service._normalize_job_row(row, "ai data analyst")
+        job = self.service._normalize_job_row(row, "ai data analyst")
         # Build a light in-memory job object shape using dict-style access helper.
         class JobObj:
             def __init__(self, payload):
@@ -75,10 +100,198 @@ class OrchestratorScoringTests(unittest.TestCase):
                 self.proposals = payload["proposals"]
                 self.budget_value = payload["budget_value"]
 
-        draft = service._build_rule_based_draft(JobObj(job), fit_score=85, safety_score=75)
+        draft = self.service._build_rule_based_draft(JobObj(job), fit_score=85, safety_score=75)
         self.assertTrue(draft["cover_letter_draft"])
         self.assertGreater(len(draft["hook_points"]), 0)
 
 
+class OrchestratorIngestTests(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine)
+        self.addCleanup(engine.dispose)
+        self.db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        self.addCleanup(self.db.close)
+        self.data_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_root, ignore_errors=True)
+        self.service = OrchestratorService(data_root=self.data_root)
+
+    def ingest_jobs(self, *jobs):
+        run = {"keyword": "ai data analyst", "data": {"jobs": list(jobs)}}
+        self.service.ingest_run_payload(self.db, "run", run, refresh_metrics=False)
+
+    def stored_job(self):
+        self.db.expire_all()
+        return self.db.query(JobRaw).filter(JobRaw.job_key == "~01").one()
+
+    def test_reingest_without_scraped_at_keeps_stored_stamp(self):
+        url = "https://www.upwork.com/jobs/~01"
+        self.ingest_jobs(
+            {"title": "ETL", "url": url, "budget": "$100",
+             "scraped_at": "2026-01-01T00:00:00", "posted_date": "2025-12-31T00:00:00"}
+        )
+        self.ingest_jobs({"title": "ETL", "url": url, "budget": "$200"})
+
+        job = self.stored_job()
+        self.assertEqual(job.budget, "$200")
+        self.assertEqual(job.scraped_at, datetime(2026, 1, 1))
+        self.assertEqual(job.posted_at, datetime(2025, 12, 31))
+
+    def test_newer_scrape_overwrites_and_keeps_posted_at(self):
+        url = "https://www.upwork.com/jobs/~01"
+        self.ingest_jobs(
+            {"title": "ETL", "url": url, "budget": "$100",
+             "scraped_at": "2026-01-01T00:00:00", "posted_date": "2025-12-31T00:00:00"}
+        )
+        self.ingest_jobs(
+            {"title": "ETL", "url": url, "budget": "$300", "scraped_at": "2026-01-02T00:00:00"}
+        )
+
+        job = self.stored_job()
+        self.assertEqual(job.budget, "$300")
+        self.assertEqual(job.scraped_at, datetime(2026, 1, 2))
+        self.assertEqual(job.posted_at, datetime(2025, 12, 31))
+
+    def test_first_ingest_without_scraped_at_is_stamped(self):
+        before = datetime.utcnow()
+        self.ingest_jobs({"title": "ETL", "url": "https://www.upwork.com/jobs/~01"})
+        self.assertGreaterEqual(self.stored_job().scraped_at, before)
+
+    def test_merge_rows_matches_bulk_upsert(self):
+        def merge(**fields):
+            row = {"title": "ETL", "url": "https://www.upwork.com/jobs/~01", **fields}
+            job = self.service._normalize_job_row(row, "ai data analyst")
+            OrchestratorService._merge_rows(self.db, JobRaw, "job_key", [job], "merge")
+            self.db.commit()
+
+        before = datetime.utcnow()
+        merge(budget="$100", posted_date="2025-12-31T00:00:00")
+        inserted = self.stored_job()
+        self.assertGreaterEqual(inserted.scraped_at, before)
+        stamp = inserted.scraped_at
+
+        merge(budget="$200")
+        job = self.stored_job()
+        self.assertEqual(job.budget, "$200")
+        self.assertEqual(job.scraped_at, stamp)
+        self.assertEqual(job.posted_at, datetime(2025, 12, 31))
+
+    def test_reingest_only_applies_newer_or_missing_scraped_at(self):
+        def bulk(jobs):
+            OrchestratorService._bulk_upsert(self.db, JobRaw, "job_key", jobs, "reingest")
+
+        def merge(jobs):
+            OrchestratorService._merge_rows(self.db, JobRaw, "job_key", jobs, "reingest")
+
+        cases = (
+            ("2025-12-31T00:00:00", "$100", datetime(2026, 1, 1)),
+            ("2026-01-01T00:00:00", "$100", datetime(2026, 1, 1)),
+            ("", "$200", datetime(2026, 1, 1)),
+        )
+        for upsert in (bulk, merge):
+            for scraped_at, budget, stamp in cases:
+                with self.subTest(path=upsert.__name__, scraped_at=scraped_at):
+                    self.db.query(JobRaw).delete()
+                    for row in (
+                        {"budget": "$100", "scraped_at": "2026-01-01T00:00:00"},
+                        {"budget": "$200", "scraped_at": scraped_at},
+                    ):
+                        row.update(title="ETL", url="https://www.upwork.com/jobs/~01")
+                        upsert([self.service._normalize_job_row(row, "ai data analyst")])
+                        self.db.commit()
+
+                    job = self.stored_job()
+                    self.assertEqual(job.budget, budget)
+                    self.assertEqual(job.scraped_at, stamp)
+
+    def test_commit_invalidates_cached_summary(self):
+        self.assertEqual(self.service.get_summary(self.db)["jobs_raw"], 0)
+        self.ingest_jobs({"title": "ETL", "url": "https://www.upwork.com/jobs/~01"})
+        self.assertEqual(self.service.get_summary(self.db)["jobs_raw"], 1)
+
+    def test_csv_aliases_and_malformed_rows(self):
+        path = Path(self.data_root) / "upwork_jobs_etl_pipeline.csv"
+        path.write_text(
+            " Job_Title ,Detail_Job_URL,Budget,Search_Keyword\n"
+            "Clean row,https://www.upwork.com/jobs/~01,$100,sql\n"
+            "Extra fields,https://www.upwork.com/jobs/~02,$200,,trailing,junk\n"
+            "Short row,https://www.upwork.com/jobs/~03\n",
+            encoding="utf-8",
+        )
+        parsed = self.service._parse_file(path)
+
+        self.assertEqual(parsed["keyword"], "etl pipeline")
+        jobs = parsed["jobs"]
+        self.assertEqual(sorted(jobs), ["~01", "~02", "~03"])
+        self.assertEqual(jobs["~01"]["title"], "Clean row")
+        self.assertEqual(jobs["~01"]["keyword"], "sql")
+        self.assertEqual(jobs["~02"]["budget"], "$200")
+        self.assertEqual(jobs["~02"]["keyword"], "etl pipeline")
+        self.assertEqual(jobs["~03"]["budget"], "")
+
+    def test_scan_ingests_changed_files_and_releases_parse_threads(self):
+        (Path(self.data_root) / "upwork_jobs_sql.csv").write_text(
+            "title,url\nETL,https://www.upwork.com/jobs/~01\n", encoding="utf-8"
+        )
+        first = self.service.scan_and_ingest(self.db)
+        second = self.service.scan_and_ingest(self.db)
+
+        self.assertEqual((first["new_files"], second["new_files"]), (1, 0))
+        self.assertEqual(self.stored_job().title, "ETL")
+        self.assertFalse(
+            [t for t in threading.enumerate() if t.name.startswith("ingest-parse")]
+        )
+
+    def test_scan_bounds_parsed_files_held_in_memory(self):
+        for index in range(6):
+            (Path(self.data_root) / f"upwork_jobs_batch_{index}.csv").write_text(
+                f"title,url\nJob {index},https://www.upwork.com/jobs/~0{index}\n", encoding="utf-8"
+            )
+        parse_file = self.service._parse_file
+        started = []
+        ahead = []
+
+        def tracking_parse(file_path):
+            started.append(file_path)
+            return parse_file(file_path)
+
+        def tracking_upsert(db, records, source_file):
+            time.sleep(0.05)  # give the parse workers time to run ahead
+            ahead.append(len(started) - len(ahead) - 1)
+            upsert_jobs(db, records, source_file)
+
+        upsert_jobs = self.service._upsert_jobs
+        self.service._parse_file = tracking_parse
+        self.service._upsert_jobs = tracking_upsert
+        with mock.patch("orchestrator.os.cpu_count", return_value=1):
+            result = self.service.scan_and_ingest(self.db)
+
+        self.assertEqual(result["new_files"], 6)
+        self.assertEqual(self.db.query(JobRaw).count(), 6)
+        self.assertLessEqual(max(ahead), 2)
+
+    def test_ingest_event_commits_with_the_ingest(self):
+        run = {
+            "keyword": "ai data analyst",
+            "data": {"jobs": [{"title": "ETL job", "url": "https://www.upwork.com/jobs/~01"}]},
+        }
+        self.service.ingest_run_payload(self.db, "run-1", run, refresh_metrics=False)
+
+        event = self.db.query(PipelineEvent).one()
+        self.assertEqual(event.event_type, "ingest_run_payload")
+        payload = json.loads(event.payload)
+        self.assertEqual(payload["run_id"], "run-1")
+        self.assertEqual(payload["jobs_ingested"], 1)
+        summary = self.service.get_summary(self.db)
+        self.assertEqual(summary["last_ingest_at"], event.created_at.isoformat())
+
+    def test_event_rolls_back_with_the_caller(self):
+        self.service._log_event(self.db, "ingest_scan", {"scanned_files": 0})
+        self.db.rollback()
+        self.assertEqual(self.db.query(PipelineEvent).count(), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
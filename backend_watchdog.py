@@ -6,13 +6,21 @@ Restarts the launchd backend service if /health is unresponsive repeatedly.
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import queue
 import subprocess
+import threading
 import time
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from pathlib import Path
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib parser also takes bytes
+    orjson = None
 
 
 PROJECT_DIR = Path("/Users/dev/Documents/upworkextension")
@@ -23,56 +31,165 @@ CHECK_INTERVAL_SECONDS = max(5, int(os.getenv("UPWORK_WATCHDOG_INTERVAL_SECONDS"
 FAIL_THRESHOLD = max(2, int(os.getenv("UPWORK_WATCHDOG_FAIL_THRESHOLD", "3")))
 RESTART_COOLDOWN_SECONDS = max(5, int(os.getenv("UPWORK_WATCHDOG_RESTART_COOLDOWN", "20")))
 REQUEST_TIMEOUT_SECONDS = max(1, int(os.getenv("UPWORK_WATCHDOG_TIMEOUT_SECONDS", "2")))
+# While healthy the interval doubles up to this, and drops back on the first failure
+MAX_CHECK_INTERVAL_SECONDS = CHECK_INTERVAL_SECONDS * 4
+
+_HEALTH = urlsplit(HEALTH_URL)
+_HEALTH_PATH = (_HEALTH.path or "/") + (f"?{_HEALTH.query}" if _HEALTH.query else "")
+# Kept open between checks so a probe doesn't pay for a new TCP connection
+_conn: HTTPConnection | None = None
+
+RESTART_TARGET = f"gui/{os.getuid()}/{BACKEND_LABEL}"
+_restart_proc: subprocess.Popen | None = None
+_last_restart = float("-inf")
+
+
+# log() hands lines to a writer thread that keeps LOG_PATH open
+_log_queue: queue.Queue[str | None] = queue.Queue(maxsize=1024)
+_log_thread: threading.Thread | None = None
+# How long log() waits on a stalled writer before dropping a line
+LOG_PUT_TIMEOUT_SECONDS = 5
+_dropped_lines = 0
+
+
+def _log_writer(handle) -> None:
+    with handle:
+        while True:
+            line = _log_queue.get()
+            if line is None:
+                return
+            handle.write(line)
+            if _log_queue.empty():
+                handle.flush()
+
+
+def _start_log_writer() -> None:
+    """(Re)start the writer; LOG_PATH is opened here so a failure raises in log()."""
+    global _log_thread
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    handle = LOG_PATH.open("a", encoding="utf-8")
+    if _log_thread is None:
+        atexit.register(_stop_log_writer)
+    _log_thread = threading.Thread(target=_log_writer, args=(handle,), name="log-writer", daemon=True)
+    _log_thread.start()
+
+
+def _stop_log_writer() -> None:
+    if _log_thread is None or not _log_thread.is_alive():
+        return
+    try:
+        _log_queue.put(None, timeout=LOG_PUT_TIMEOUT_SECONDS)
+    except queue.Full:
+        return
+    _log_thread.join(timeout=5)
 
 
 def log(message: str) -> None:
+    global _dropped_lines
     ts = time.strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{ts}] {message}\n"
-    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with LOG_PATH.open("a", encoding="utf-8") as handle:
-        handle.write(line)
+    if _dropped_lines:
+        line = f"[{ts}] {_dropped_lines} log line(s) dropped while the writer was stalled\n" + line
+    if _log_thread is None or not _log_thread.is_alive():
+        _start_log_writer()
+    try:
+        _log_queue.put(line, timeout=LOG_PUT_TIMEOUT_SECONDS)
+    except queue.Full:
+        _dropped_lines += 1
+        return
+    _dropped_lines = 0
+
+
+def _get_health() -> tuple[int, bytes]:
+    global _conn
+    reused = _conn is not None
+    if _conn is None:
+        connection_class = HTTPSConnection if _HEALTH.scheme == "https" else HTTPConnection
+        _conn = connection_class(_HEALTH.hostname, _HEALTH.port, timeout=REQUEST_TIMEOUT_SECONDS)
+    try:
+        _conn.request("GET", _HEALTH_PATH, headers={"Accept": "application/json"})
+        response = _conn.getresponse()
+        body = response.read()  # read to the end so the connection can carry the next check
+    except (HTTPException, OSError) as exc:
+        _conn.close()
+        _conn = None
+        if reused and isinstance(exc, ConnectionError):
+            # The server closed the idle connection since the last check; not a failure
+            return _get_health()
+        raise
+    if response.will_close:
+        _conn.close()
+        _conn = None
+    return response.status, body
 
 
 def health_ok() -> bool:
-    req = Request(HEALTH_URL, headers={"Accept": "application/json"})
     try:
-        with urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as response:
-            if int(getattr(response, "status", 0)) != 200:
-                return False
-            payload = json.loads(response.read().decode("utf-8"))
-            return payload.get("status") == "healthy"
-    except (URLError, TimeoutError, ValueError, OSError):
+        status, body = _get_health()
+        if status != 200:
+            return False
+        payload = orjson.loads(body) if orjson is not None else json.loads(body)
+        return payload.get("status") == "healthy"
+    except (HTTPException, ValueError, OSError):
         return False
 
 
-def restart_backend() -> None:
-    uid = os.getuid()
-    target = f"gui/{uid}/{BACKEND_LABEL}"
-    subprocess.run(["launchctl", "kickstart", "-k", target], check=False)
-    log(f"Watchdog restart requested for {target}")
+def reap_restart() -> bool:
+    """Collect a finished kickstart and log a failed one; False while it still runs."""
+    global _restart_proc
+    if _restart_proc is None:
+        return True
+    returncode = _restart_proc.poll()
+    if returncode is None:
+        return False
+    if returncode != 0:
+        log(f"Kickstart exited with {returncode}")
+    _restart_proc = None
+    return True
+
+
+def restart_backend() -> bool:
+    """Start a launchctl kickstart without waiting on it; False if one is too recent."""
+    global _restart_proc, _last_restart
+    if time.monotonic() - _last_restart < RESTART_COOLDOWN_SECONDS:
+        return False
+    if not reap_restart():
+        return False  # the previous kickstart is still running
+    _restart_proc = subprocess.Popen(
+        ["launchctl", "kickstart", "-k", RESTART_TARGET],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    _last_restart = time.monotonic()
+    log(f"Watchdog restart requested for {RESTART_TARGET}")
+    return True
 
 
 def main() -> None:
     log(
         "Watchdog started "
-        f"(url={HEALTH_URL}, interval={CHECK_INTERVAL_SECONDS}s, fail_threshold={FAIL_THRESHOLD})"
+        f"(url={HEALTH_URL}, interval={CHECK_INTERVAL_SECONDS}-{MAX_CHECK_INTERVAL_SECONDS}s, "
+        f"fail_threshold={FAIL_THRESHOLD})"
     )
     consecutive_failures = 0
+    interval = CHECK_INTERVAL_SECONDS
     while True:
+        reap_restart()
         if health_ok():
             if consecutive_failures:
                 log("Health recovered; failure counter reset")
             consecutive_failures = 0
-            time.sleep(CHECK_INTERVAL_SECONDS)
+            time.sleep(interval)
+            interval = min(interval * 2, MAX_CHECK_INTERVAL_SECONDS)
             continue
 
+        interval = CHECK_INTERVAL_SECONDS
         consecutive_failures += 1
         log(f"Health check failed ({consecutive_failures}/{FAIL_THRESHOLD})")
-        if consecutive_failures >= FAIL_THRESHOLD:
-            restart_backend()
+        # Keep checking while the restart runs; restart_backend() enforces the cooldown
+        if consecutive_failures >= FAIL_THRESHOLD and restart_backend():
             consecutive_failures = 0
-            time.sleep(RESTART_COOLDOWN_SECONDS)
-            continue
 
         time.sleep(CHECK_INTERVAL_SECONDS)
 
@@ -6,15 +6,27 @@ Starts all components: auto-sync, dashboard, and controls the workflow
 
 import os
 import sys
+import atexit
+import logging
+import queue
+import select
+import signal
 import subprocess
 import time
 import json
 import socket
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional; json is used when it isn't installed
+    orjson = None
+
 # Paths
 PROJECT_DIR = Path("/Users/dev/Documents/upworkextension")
 EXTENSION_DIR = PROJECT_DIR / "original_repo_v2"
@@ -27,6 +39,13 @@ DASHBOARD_APP = ANALIST_DIR / "dashboard" / "app.py"
 BACKEND_APP = BACKEND_DIR / "main.py"
 PID_FILE = PROJECT_DIR / ".upwork_dna_pids.json"
 LOG_FILE = PROJECT_DIR / "upwork_dna.log"
+RESTART_COOLDOWN_SECONDS = 5
+# Per-component restart backoff: a component that keeps crashing waits twice as long
+# before each restart, up to MAX_RESTART_BACKOFF_SECONDS, and is given up on after
+# MAX_RESTART_ATTEMPTS crashes in a row; staying up STABLE_UPTIME_SECONDS resets it
+MAX_RESTART_BACKOFF_SECONDS = 300
+MAX_RESTART_ATTEMPTS = 8
+STABLE_UPTIME_SECONDS = 60
 
 
 def pick_python(*candidates):
@@ -46,12 +65,33 @@ YELLOW = "\033[93m"
 RED = "\033[91m"
 RESET = "\033[0m"
 
+# log() prints to the console directly and hands file lines to a listener thread
+logger = logging.getLogger("upwork_dna")
+logger.propagate = False
+_log_listener = None
+
+def _start_logging():
+    """Attach the console and (rotating) LOG_FILE handlers to logger"""
+    global _log_listener
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter(f"%(color)s[%(asctime)s] %(message)s{RESET}", "%H:%M:%S"))
+
+    log_file = RotatingFileHandler(LOG_FILE, maxBytes=5_000_000, backupCount=3, delay=True)
+    log_file.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", "%H:%M:%S"))
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, log_file)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # drains the queue before exit
+
+    logger.setLevel(logging.INFO)
+    logger.addHandler(console)
+    logger.addHandler(QueueHandler(log_queue))
+
 def log(message, color=""):
     """Log message with timestamp"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"{color}[{timestamp}] {message}{RESET}")
-    with open(LOG_FILE, "a") as f:
-        f.write(f"[{timestamp}] {message}\n")
+    if _log_listener is None:
+        _start_logging()
+    logger.info(message, extra={"color": color})
 
 def is_running(pid):
     """Check if process is running"""
@@ -61,16 +101,21 @@ def is_running(pid):
     except OSError:
         return False
 
-def save_pids(pids):
-    """Save process IDs to file"""
+def save_pids(procs):
+    """Save the started processes' IDs to file"""
     with open(PID_FILE, "w") as f:
-        json.dump({k: str(v) for k, v in pids.items()}, f)
+        json.dump({k: str(p.pid) for k, p in procs.items()}, f)
+
+def load_json(path):
+    """Parse a JSON file, with orjson when it is available"""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 def load_pids():
     """Load process IDs from file"""
     if PID_FILE.exists():
-        with open(PID_FILE, "r") as f:
-            return json.load(f)
+        return load_json(PID_FILE)
     return {}
 
 
@@ -93,6 +138,12 @@ def is_http_ok(url, timeout=1.5):
     except Exception:
         return False
 
+
+def check_endpoints(urls, timeout=1.5):
+    """Probe all urls at once with is_http_ok; returns {url: ok}."""
+    with ThreadPoolExecutor(max_workers=max(1, len(urls))) as pool:
+        return dict(zip(urls, pool.map(lambda url: is_http_ok(url, timeout), urls)))
+
 def stop_existing():
     """Stop existing processes"""
     pids = load_pids()
@@ -108,61 +159,77 @@ def stop_existing():
             pass
     return stopped
 
+def open_child_log(path):
+    """Open path for appending as a raw fd, to hand to a child as its stdout"""
+    return os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
 def start_auto_sync():
     """Start the auto-sync script"""
     log("Starting auto-sync script...", BLUE)
-    process = subprocess.Popen(
-        [ANALIST_PYTHON, str(SYNC_SCRIPT)],
-        cwd=str(PROJECT_DIR),
-        stdout=open(PROJECT_DIR / "auto_sync.log", "a"),
-        stderr=subprocess.STDOUT
-    )
+    log_fd = open_child_log(PROJECT_DIR / "auto_sync.log")
+    try:
+        process = subprocess.Popen(
+            [ANALIST_PYTHON, str(SYNC_SCRIPT)],
+            cwd=str(PROJECT_DIR),
+            stdout=log_fd,
+            stderr=subprocess.STDOUT
+        )
+    finally:
+        os.close(log_fd)  # the child has its own copy
     log(f"Auto-sync started (PID {process.pid})", GREEN)
-    return {"auto_sync": process.pid}
+    return {"auto_sync": process}
 
 
 def start_orchestrator():
     """Start local FastAPI orchestrator on port 8000."""
     log("Starting orchestrator API...", BLUE)
-    process = subprocess.Popen(
-        [
-            BACKEND_PYTHON,
-            "-m",
-            "uvicorn",
-            "main:app",
-            "--host",
-            "127.0.0.1",
-            "--port",
-            "8000",
-        ],
-        cwd=str(BACKEND_DIR),
-        stdout=open(PROJECT_DIR / "orchestrator.log", "a"),
-        stderr=subprocess.STDOUT,
-    )
+    log_fd = open_child_log(PROJECT_DIR / "orchestrator.log")
+    try:
+        process = subprocess.Popen(
+            [
+                BACKEND_PYTHON,
+                "-m",
+                "uvicorn",
+                "main:app",
+                "--host",
+                "127.0.0.1",
+                "--port",
+                "8000",
+            ],
+            cwd=str(BACKEND_DIR),
+            stdout=log_fd,
+            stderr=subprocess.STDOUT,
+        )
+    finally:
+        os.close(log_fd)  # the child has its own copy
     log(f"Orchestrator started on http://127.0.0.1:8000 (PID {process.pid})", GREEN)
-    return {"orchestrator": process.pid}
+    return {"orchestrator": process}
 
 def start_dashboard():
     """Start the Streamlit dashboard"""
     log("Starting dashboard...", BLUE)
-    process = subprocess.Popen(
-        [
-            ANALIST_PYTHON,
-            "-m",
-            "streamlit",
-            "run",
-            "dashboard/app.py",
-            "--server.headless",
-            "true",
-            "--server.port",
-            "8501",
-        ],
-        cwd=str(ANALIST_DIR),
-        stdout=open(PROJECT_DIR / "dashboard.log", "a"),
-        stderr=subprocess.STDOUT
-    )
+    log_fd = open_child_log(PROJECT_DIR / "dashboard.log")
+    try:
+        process = subprocess.Popen(
+            [
+                ANALIST_PYTHON,
+                "-m",
+                "streamlit",
+                "run",
+                "dashboard/app.py",
+                "--server.headless",
+                "true",
+                "--server.port",
+                "8501",
+            ],
+            cwd=str(ANALIST_DIR),
+            stdout=log_fd,
+            stderr=subprocess.STDOUT
+        )
+    finally:
+        os.close(log_fd)  # the child has its own copy
     log(f"Dashboard started on http://localhost:8501 (PID {process.pid})", GREEN)
-    return {"dashboard": process.pid}
+    return {"dashboard": process}
 
 def ensure_directories():
     """Ensure all required directories exist"""
@@ -176,10 +243,24 @@ def check_extension_queue():
     # We'll create a simple file-based queue indicator
     queue_file = PROJECT_DIR / "queue_status.json"
     if queue_file.exists():
-        with open(queue_file, "r") as f:
-            return json.load(f)
+        return load_json(queue_file)
     return {"queue": [], "active": False}
 
+def scan_files(root, suffixes, recursive=False):
+    """Yield os.DirEntry objects under root whose names end with one of suffixes."""
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                if entry.name.endswith(suffixes):
+                    yield entry
+
 def print_status():
     """Print system status"""
     print("\n" + "="*60)
@@ -196,29 +277,30 @@ def print_status():
                 print(f"📡 Auto-Sync: {GREEN}Active{RESET}")
                 print(f"   Last: {last_line[:50]}...")
 
-    # Check dashboard
-    try:
-        urllib.request.urlopen("http://localhost:8501", timeout=1)
+    # Check dashboard and orchestrator together, so a hung one costs one timeout
+    endpoints = check_endpoints(["http://localhost:8501", "http://127.0.0.1:8000/health"], timeout=1)
+    if endpoints["http://localhost:8501"]:
         print(f"📊 Dashboard: {GREEN}Running{RESET} at http://localhost:8501")
-    except:
+    else:
         print(f"📊 Dashboard: {RED}Not responding{RESET}")
 
-    try:
-        urllib.request.urlopen("http://127.0.0.1:8000/health", timeout=1)
+    if endpoints["http://127.0.0.1:8000/health"]:
         print(f"🧠 Orchestrator: {GREEN}Running{RESET} at http://127.0.0.1:8000")
-    except:
+    else:
         print(f"🧠 Orchestrator: {RED}Not responding{RESET}")
 
     # Check for new data
-    data_files = list(DATA_DIR.glob("*.csv")) + list(DATA_DIR.glob("*.json"))
+    # One directory read per tree; DirEntry.stat() is only called when the name lacks today's date
+    data_files = list(scan_files(DATA_DIR, (".csv", ".json")))
     today = datetime.now().strftime("%Y-%m-%d")
-    today_files = [f for f in data_files if today in f.name or f.stat().st_mtime > time.time() - 86400]
+    cutoff = time.time() - 86400
+    today_files = [f for f in data_files if today in f.name or f.stat().st_mtime > cutoff]
 
     print(f"📁 Data Files: {len(data_files)} total, {len(today_files)} from today")
 
     # Check downloads directory
-    download_files = list(DOWNLOADS_DIR.glob("**/*.csv")) + list(DOWNLOADS_DIR.glob("**/*.json"))
-    print(f"⬇️  Downloads: {len(download_files)} files")
+    download_count = sum(1 for _ in scan_files(DOWNLOADS_DIR, (".csv", ".json"), recursive=True))
+    print(f"⬇️  Downloads: {download_count} files")
 
     # Queue status
     queue = check_extension_queue()
@@ -228,10 +310,9 @@ def print_status():
     # Check NLP keywords
     nlp_file = DATA_DIR / "recommended_keywords.json"
     if nlp_file.exists():
-        with open(nlp_file) as f:
-            nlp_data = json.load(f)
-            if nlp_data.get("keywords"):
-                print(f"🤖 NLP Keywords: {len(nlp_data['keywords'])} generated")
+        nlp_data = load_json(nlp_file)
+        if nlp_data.get("keywords"):
+            print(f"🤖 NLP Keywords: {len(nlp_data['keywords'])} generated")
 
     print("="*60 + "\n")
 
@@ -267,6 +348,138 @@ def wait_for_orchestrator(timeout_seconds=20):
         time.sleep(0.5)
     return False
 
+STARTERS = {
+    "auto_sync": start_auto_sync,
+    "orchestrator": start_orchestrator,
+    "dashboard": start_dashboard,
+}
+
+def start_all():
+    """Start every component that isn't already up; returns {name: Popen} for those started here"""
+    ensure_directories()
+
+    procs = {}
+    orchestrator_running = is_http_ok("http://127.0.0.1:8000/health", timeout=1)
+    if orchestrator_running:
+        log("Orchestrator already running on 127.0.0.1:8000, skipping start.", GREEN)
+    else:
+        if is_port_open(8000):
+            log("Port 8000 is in use but /health is not responding. Stop conflicting process first.", RED)
+            sys.exit(1)
+        procs.update(start_orchestrator())
+        if not wait_for_orchestrator(timeout_seconds=20):
+            log("Orchestrator failed health check on port 8000.", RED)
+            sys.exit(1)
+        log("Orchestrator health check passed.", GREEN)
+
+    procs.update(start_auto_sync())
+    time.sleep(1)
+
+    if is_port_open(8501):
+        log("Port 8501 already in use; dashboard start skipped (API remains active).", YELLOW)
+    else:
+        procs.update(start_dashboard())
+
+    return procs
+
+def restart_orchestrator():
+    """Restart the orchestrator behind the same port and health gates as start_all; {} on failure"""
+    if is_port_open(8000):
+        log("Port 8000 is still in use but the orchestrator is gone; restart deferred.", RED)
+        return {}
+    started = start_orchestrator()
+    if wait_for_orchestrator(timeout_seconds=20):
+        log("Orchestrator health check passed.", GREEN)
+        return started
+    log("Orchestrator failed health check on port 8000.", RED)
+    process = started["orchestrator"]
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    return {}
+
+RESTARTERS = {**STARTERS, "orchestrator": restart_orchestrator}
+
+def restart_delay(crashes):
+    """Seconds to wait before restarting a component after its crashes-th crash in a row"""
+    if crashes <= 1:
+        return 0
+    return min(RESTART_COOLDOWN_SECONDS * 2 ** (crashes - 2), MAX_RESTART_BACKOFF_SECONDS)
+
+def supervise(procs):
+    """Restart any of procs that exits, with per-component backoff, until interrupted"""
+    # SIGCHLD writes a byte to wake_r, so a dead child wakes the loop right away;
+    # the 10s timeout remains as a fallback
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_r, False)
+    os.set_blocking(wake_w, False)
+    old_wakeup_fd = signal.set_wakeup_fd(wake_w)
+    old_handler = signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    crashes = {}  # name -> crashes in a row
+    started_at = {name: time.monotonic() for name in procs}
+    due = {}  # name -> when its pending restart may run
+    failed = set()  # names whose last restart attempt did not start them
+    try:
+        while True:
+            # A failed restart is handled right away, like a fresh crash
+            timeout = 0 if failed - due.keys() else min(
+                [10] + [when - time.monotonic() for when in due.values()]
+            )
+            select.select([wake_r], [], [], max(0, timeout))
+            try:
+                while os.read(wake_r, 512):
+                    pass
+            except BlockingIOError:
+                pass
+
+            changed = False
+            for name, process in list(procs.items()):
+                if process.poll() is None:
+                    continue
+                now = time.monotonic()
+                if name not in due:
+                    # A component that failed to come back counts as crashing again
+                    if now - started_at[name] >= STABLE_UPTIME_SECONDS:
+                        crashes[name] = 0
+                    crashes[name] = crashes.get(name, 0) + 1
+                    if crashes[name] > MAX_RESTART_ATTEMPTS:
+                        log(f"{name} failed {MAX_RESTART_ATTEMPTS} times in a row; giving up on it", RED)
+                        del procs[name]
+                        failed.discard(name)
+                        changed = True
+                        continue
+                    delay = restart_delay(crashes[name])
+                    if name in failed:
+                        log(f"Restart of {name} failed; retrying in {delay}s", RED)
+                    else:
+                        log(f"Process {name} (PID {process.pid}) died! Restarting in {delay}s...", RED)
+                    due[name] = now + delay
+                if now < due[name]:
+                    continue
+                del due[name]
+                try:
+                    started = RESTARTERS[name]()
+                except OSError as exc:
+                    log(f"Could not start {name}: {exc}", RED)
+                    started = {}
+                procs.update(started)
+                started_at[name] = time.monotonic()
+                if started:
+                    failed.discard(name)
+                else:
+                    failed.add(name)
+                changed = True
+            if changed:
+                save_pids(procs)
+    finally:
+        signal.signal(signal.SIGCHLD, old_handler)
+        signal.set_wakeup_fd(old_wakeup_fd)
+        os.close(wake_r)
+        os.close(wake_w)
+
 def main():
     """Main launch manager"""
     print("\n" + "="*60)
@@ -300,32 +513,8 @@ def main():
         time.sleep(2)
         # Fall through to start
 
-    # Start everything
-    ensure_directories()
-
-    pids = {}
-    orchestrator_running = is_http_ok("http://127.0.0.1:8000/health", timeout=1)
-    if orchestrator_running:
-        log("Orchestrator already running on 127.0.0.1:8000, skipping start.", GREEN)
-    else:
-        if is_port_open(8000):
-            log("Port 8000 is in use but /health is not responding. Stop conflicting process first.", RED)
-            sys.exit(1)
-        pids.update(start_orchestrator())
-        if not wait_for_orchestrator(timeout_seconds=20):
-            log("Orchestrator failed health check on port 8000.", RED)
-            sys.exit(1)
-        log("Orchestrator health check passed.", GREEN)
-
-    pids.update(start_auto_sync())
-    time.sleep(1)
-
-    if is_port_open(8501):
-        log("Port 8501 already in use; dashboard start skipped (API remains active).", YELLOW)
-    else:
-        pids.update(start_dashboard())
-
-    save_pids(pids)
+    procs = start_all()
+    save_pids(procs)
 
     log("\n" + "="*60, GREEN)
     log("SYSTEM STARTED SUCCESSFULLY!", GREEN)
@@ -343,26 +532,7 @@ def main():
     log("\nPress Ctrl+C to stop all services\n", BLUE)
 
     try:
-        while True:
-            time.sleep(10)
-            # Check if processes are still running
-            all_running = True
-            for name, pid_str in load_pids().items():
-                try:
-                    pid = int(pid_str)
-                    if not is_running(pid):
-                        log(f"Process {name} (PID {pid}) died!", RED)
-                        all_running = False
-                except (ValueError, OSError):
-                    pass
-
-            if not all_running:
-                log("Some processes died. Restarting...", YELLOW)
-                stop_existing()
-                time.sleep(2)
-                main()  # Restart
-                return
-
+        supervise(procs)
     except KeyboardInterrupt:
         log("\nShutting down...", YELLOW)
         stop_existing()